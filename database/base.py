@@ -4,11 +4,16 @@ from sqlalchemy.orm import declarative_base
 from sqlalchemy import text
 from config.settings import settings
 
+# SQLAlchemy caches compiled SQL per statement shape; the app issues a few hundred distinct
+# ORM statements, so the cache is sized above the default 500 to keep hot ones from evicting
+QUERY_CACHE_SIZE = 1200
+
 engine = create_async_engine(
     settings.database_url,
     echo=False,
     future=True,
-    pool_pre_ping=True
+    pool_pre_ping=True,
+    query_cache_size=QUERY_CACHE_SIZE
 )
 
 # Create async session factory
@@ -83,7 +83,11 @@ export function VideoConversionModal({ isOpen, onClose, videoDirectory, scanData
                     setCurrentFile(data.file);
                     setProgress((data.current / data.total) * 50);
                     break;
-                  
+
+                  case 'progress':
+                    setCurrentFile(`${data.file} (${data.percent}%)`);
+                    break;
+
                   case 'converted':
                     setConvertedFiles(prev => [...prev, data.file]);
                     break;
@@ -42,6 +42,8 @@ async def test_url():
             
     except Exception as e:
         logger.error(f"✗ Error scraping article: {e}", exc_info=True)
+    finally:
+        await scraper.aclose()
 
 if __name__ == "__main__":
     asyncio.run(test_url())
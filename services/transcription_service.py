@@ -6,24 +6,79 @@ Supports:
 - Faster Whisper (fast, local)
 - Vosk (fallback, local)
 """
+import asyncio
+import hashlib
 import logging
 import tempfile
 import os
 import time
+from collections import OrderedDict
 from typing import Optional, Tuple
 
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 logger = logging.getLogger(__name__)
 
+# Recent-result cache for repeated identical uploads (UI retries, agent loops)
+RECENT_CACHE_MAX_SIZE = 64
+RECENT_CACHE_TTL_S = 60.0
+
+# Segments decoded per encoder pass by Faster Whisper's batched pipeline
+FASTER_WHISPER_BATCH_SIZE = 8
+
+# Frames fed to the Vosk recognizer per AcceptWaveform call
+VOSK_CHUNK_FRAMES = 4000
+
 
 class TranscriptionService:
     """Handle audio transcription with multiple providers."""
     
+    # Per-provider time budgets; on timeout the fallback chain moves on
+    deepgram_timeout_s = 3.0
+    fw_timeout_s = 10.0
+    
     def __init__(self):
         self.deepgram_client = None
         self.faster_whisper_model = None
+        self._faster_whisper_batched = None
         self.vosk_model = None
+        self._vosk_model_path: Optional[str] = None
+        # key -> (expires_at, (transcript, provider, latency_ms)), oldest first
+        self._recent: "OrderedDict[bytes, Tuple[float, Tuple[str, str, float]]]" = OrderedDict()
     
-    async def transcribe(self, audio_bytes: bytes, filename: str = "audio.webm") -> Tuple[Optional[str], str, float]:
+    @staticmethod
+    def _audio_key(audio_bytes: bytes) -> bytes:
+        """Hash audio bytes into a compact cache key."""
+        return hashlib.blake2b(audio_bytes, digest_size=16).digest()
+    
+    def _get_recent(self, key: bytes) -> Optional[Tuple[str, str, float]]:
+        """Return a cached result for key if present and not expired."""
+        entry = self._recent.get(key)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at < time.monotonic():
+            del self._recent[key]
+            return None
+        self._recent.move_to_end(key)
+        return result
+    
+    def _put_recent(self, key: bytes, result: Tuple[str, str, float]) -> None:
+        """Store a successful result, evicting the least recently used entry."""
+        self._recent[key] = (time.monotonic() + RECENT_CACHE_TTL_S, result)
+        self._recent.move_to_end(key)
+        while len(self._recent) > RECENT_CACHE_MAX_SIZE:
+            self._recent.popitem(last=False)
+    
+    async def transcribe(
+        self,
+        audio_bytes: bytes,
+        filename: str = "audio.webm",
+        no_cache: bool = False,
+    ) -> Tuple[Optional[str], str, float]:
         """
         Transcribe audio using the best available provider.
         
@@ -32,21 +87,50 @@ class TranscriptionService:
         2. Faster Whisper (if model available)
         3. Vosk (fallback)
         
+        Identical audio submitted again within RECENT_CACHE_TTL_S returns the
+        previous result without calling any provider. Pass no_cache=True for
+        streaming/live audio.
+        
         Returns:
             (transcript_text, provider_name, latency_ms)
         """
+        key = None
+        if not no_cache:
+            key = self._audio_key(audio_bytes)
+            cached = self._get_recent(key)
+            if cached is not None:
+                logger.info(f"[TRANSCRIBE] Cache hit ({cached[1]})")
+                return cached
+        
+        result = await self._transcribe_uncached(audio_bytes, filename)
+        if key is not None and result[0]:
+            self._put_recent(key, result)
+        return result
+    
+    async def _transcribe_uncached(self, audio_bytes: bytes, filename: str) -> Tuple[Optional[str], str, float]:
+        """Run the provider fallback chain."""
+        # Once Faster Whisper is in use, decode its input while Deepgram is in flight
+        decoded_audio = None
+        if self.faster_whisper_model is not None:
+            decoded_audio = asyncio.ensure_future(
+                asyncio.to_thread(self._decode_for_faster_whisper, audio_bytes)
+            )
+        
         # Try Deepgram first
         try:
             transcript, latency = await self._transcribe_deepgram(audio_bytes)
             if transcript:
                 logger.info(f"[TRANSCRIBE] Deepgram success: {latency:.0f}ms")
+                # Drop the prefetch; if it already finished, retrieve any error so it isn't logged
+                if decoded_audio is not None and not decoded_audio.cancel():
+                    decoded_audio.exception()
                 return transcript, "deepgram", latency
         except Exception as e:
             logger.debug(f"[TRANSCRIBE] Deepgram unavailable: {e}")
         
         # Try Faster Whisper
         try:
-            transcript, latency = await self._transcribe_faster_whisper(audio_bytes, filename)
+            transcript, latency = await self._transcribe_faster_whisper(audio_bytes, filename, decoded_audio)
             if transcript:
                 logger.info(f"[TRANSCRIBE] Faster Whisper success: {latency:.0f}ms")
                 return transcript, "faster-whisper", latency
@@ -96,11 +180,20 @@ class TranscriptionService:
                 punctuate=True,
             )
             
-            # Transcribe
-            response = self.deepgram_client.listen.prerecorded.v("1").transcribe_file(
-                source,
-                options
-            )
+            # Transcribe (blocking SDK call, run off the event loop with a deadline)
+            try:
+                response = await asyncio.wait_for(
+                    asyncio.to_thread(
+                        self.deepgram_client.listen.prerecorded.v("1").transcribe_file,
+                        source,
+                        options
+                    ),
+                    timeout=self.deepgram_timeout_s
+                )
+            except asyncio.TimeoutError:
+                elapsed = (time.time() - start) * 1000
+                logger.warning(f"[TRANSCRIBE] Deepgram timed out after {elapsed:.0f}ms")
+                return None, elapsed
             
             # Extract transcript
             if response and response.results and response.results.channels:
@@ -117,7 +210,19 @@ class TranscriptionService:
             logger.warning(f"[TRANSCRIBE] Deepgram error: {e}")
             return None, 0.0
     
-    async def _transcribe_faster_whisper(self, audio_bytes: bytes, filename: str) -> Tuple[Optional[str], float]:
+    @staticmethod
+    def _decode_for_faster_whisper(audio_bytes: bytes):
+        """Decode audio bytes to the 16 kHz mono float32 array Faster Whisper consumes."""
+        import io
+        from faster_whisper import decode_audio
+        return decode_audio(io.BytesIO(audio_bytes), sampling_rate=16000)
+    
+    async def _transcribe_faster_whisper(
+        self,
+        audio_bytes: bytes,
+        filename: str,
+        decoded_audio: Optional["asyncio.Future"] = None,
+    ) -> Tuple[Optional[str], float]:
         """Transcribe using Faster Whisper (local)."""
         start = time.time()
         
@@ -133,32 +238,50 @@ class TranscriptionService:
                     compute_type="int8",  # Optimized for CPU
                     num_workers=2
                 )
+                try:
+                    from faster_whisper import BatchedInferencePipeline
+                    self._faster_whisper_batched = BatchedInferencePipeline(model=self.faster_whisper_model)
+                except ImportError:
+                    # Older faster-whisper without batched inference
+                    self._faster_whisper_batched = None
+            
+            # Decoded 16 kHz PCM, possibly already prepared while Deepgram was running
+            if decoded_audio is not None:
+                audio = await decoded_audio
+            else:
+                audio = await asyncio.to_thread(self._decode_for_faster_whisper, audio_bytes)
             
-            # Save to temp file
-            with tempfile.NamedTemporaryFile(suffix=os.path.splitext(filename)[1] or '.webm', delete=False) as f:
-                f.write(audio_bytes)
-                temp_path = f.name
+            def run_model() -> str:
+                # Transcribe (batched pipeline decodes VAD segments in one encoder pass)
+                if self._faster_whisper_batched is not None:
+                    segments, info = self._faster_whisper_batched.transcribe(
+                        audio,
+                        beam_size=5,
+                        language="en",
+                        batch_size=FASTER_WHISPER_BATCH_SIZE
+                    )
+                else:
+                    segments, info = self.faster_whisper_model.transcribe(
+                        audio,
+                        beam_size=5,
+                        language="en"
+                    )
+                
+                # Combine segments (decoding happens lazily while iterating)
+                return " ".join([segment.text for segment in segments])
             
             try:
-                # Transcribe
-                segments, info = self.faster_whisper_model.transcribe(
-                    temp_path,
-                    beam_size=5,
-                    language="en"
+                transcript = await asyncio.wait_for(
+                    asyncio.to_thread(run_model),
+                    timeout=self.fw_timeout_s
                 )
-                
-                # Combine segments
-                transcript = " ".join([segment.text for segment in segments])
+            except asyncio.TimeoutError:
                 elapsed = (time.time() - start) * 1000
-                
-                return transcript.strip(), elapsed
-                
-            finally:
-                # Cleanup temp file
-                try:
-                    os.unlink(temp_path)
-                except:
-                    pass
+                logger.warning(f"[TRANSCRIBE] Faster Whisper timed out after {elapsed:.0f}ms")
+                return None, elapsed
+            
+            elapsed = (time.time() - start) * 1000
+            return transcript.strip(), elapsed
                     
         except ImportError:
             logger.debug("[TRANSCRIBE] Faster Whisper not installed")
@@ -167,6 +290,30 @@ class TranscriptionService:
             logger.warning(f"[TRANSCRIBE] Faster Whisper error: {e}")
             return None, 0.0
     
+    def _find_vosk_model_path(self) -> Optional[str]:
+        """Locate the Vosk model directory, remembering the result once the model is loaded."""
+        if self._vosk_model_path and self.vosk_model is not None:
+            return self._vosk_model_path
+        
+        model_root = os.path.join(os.path.dirname(__file__), "..", "models", "vosk")
+        preferred = os.path.join(model_root, "vosk-model-en-us-0.22")
+        selected_model = None
+        
+        if os.path.isdir(preferred):
+            selected_model = preferred
+        elif os.path.isdir(model_root):
+            with os.scandir(model_root) as it:
+                dirs = [entry.path for entry in it if entry.is_dir()]
+            if dirs:
+                selected_model = dirs[0]
+        
+        if not selected_model:
+            logger.warning(f"[TRANSCRIBE] Vosk model not found at {model_root}")
+            return None
+        
+        self._vosk_model_path = selected_model
+        return selected_model
+    
     async def _transcribe_vosk(self, audio_bytes: bytes, filename: str) -> Tuple[Optional[str], float]:
         """Transcribe using Vosk (local, fallback)."""
         start = time.time()
@@ -175,30 +322,16 @@ class TranscriptionService:
             from vosk import Model, KaldiRecognizer
             import wave
             import io
-            import json
             import subprocess
             import soundfile as sf
             import numpy as np
             
-            # Find Vosk model
-            model_root = os.path.join(os.path.dirname(__file__), "..", "models", "vosk")
-            preferred = os.path.join(model_root, "vosk-model-en-us-0.22")
-            selected_model = None
-            
-            if os.path.isdir(preferred):
-                selected_model = preferred
-            elif os.path.isdir(model_root):
-                entries = [os.path.join(model_root, d) for d in os.listdir(model_root)]
-                dirs = [d for d in entries if os.path.isdir(d)]
-                if dirs:
-                    selected_model = dirs[0]
-            
-            if not selected_model or not os.path.isdir(selected_model):
-                logger.warning(f"[TRANSCRIBE] Vosk model not found at {model_root}")
+            selected_model = self._find_vosk_model_path()
+            if not selected_model:
                 return None, 0.0
             
             # Initialize model if needed
-            if not self.vosk_model or self.vosk_model != selected_model:
+            if self.vosk_model is None:
                 logger.info(f"[TRANSCRIBE] Loading Vosk model: {selected_model}")
                 self.vosk_model = Model(selected_model)
             
@@ -253,17 +386,25 @@ class TranscriptionService:
                 return None, 0.0
             
             # Transcribe
-            wf = wave.open(io.BytesIO(wav_bytes), "rb")
+            wav_io = io.BytesIO(wav_bytes)
+            wf = wave.open(wav_io, "rb")
             rec = KaldiRecognizer(self.vosk_model, wf.getframerate())
             
-            while True:
-                data = wf.readframes(4000)
-                if len(data) == 0:
+            # wave.open leaves wav_io at the start of the PCM data, so read
+            # frames straight into one reusable buffer instead of readframes()
+            frame_bytes = wf.getsampwidth() * wf.getnchannels()
+            remaining = wf.getnframes() * frame_bytes
+            buf = memoryview(bytearray(VOSK_CHUNK_FRAMES * frame_bytes))
+            
+            while remaining > 0:
+                n = wav_io.readinto(buf[:remaining])
+                if n == 0:
                     break
-                rec.AcceptWaveform(data)
+                remaining -= n
+                rec.AcceptWaveform(bytes(buf[:n]))
             
             result = rec.FinalResult()
-            transcript = json.loads(result).get("text", "").strip()
+            transcript = json_loads(result).get("text", "").strip()
             elapsed = (time.time() - start) * 1000
             
             return transcript if transcript else None, elapsed
@@ -1,15 +1,28 @@
 """Text-to-Speech service using Fish Audio API SDK."""
-import json
 import asyncio
+import itertools
+import time
 from typing import Optional
 import logging
 from pathlib import Path
-from datetime import datetime
 from fish_audio_sdk import AsyncWebSocketSession, TTSRequest
 from utils.text_cleaner import clean_text_for_tts
 
 logger = logging.getLogger(__name__)
 
+# Output formats supported by Fish Audio and the media type to serve them with.
+# Opus at low bitrates matches MP3 quality in a fraction of the bytes; Fish Audio
+# wraps it in an Ogg container. Raw PCM is left out: without a requested sample
+# rate there is no accurate audio/L16 type to serve it with.
+AUDIO_MEDIA_TYPES = {
+    "mp3": "audio/mpeg",
+    "opus": "audio/ogg; codecs=opus",
+    "wav": "audio/wav",
+}
+
+# Disambiguates saved files generated within the same nanosecond
+_file_counter = itertools.count()
+
 
 class TTSService:
     """Service for converting text to speech using Fish Audio API SDK."""
@@ -39,7 +52,7 @@ class TTSService:
         """Get the path to the audio directory."""
         return Path(__file__).parent.parent / "data" / "audio"
     
-    async def generate_audio_simple(self, text: str, voice_id: str, voice_engine: str = "s1") -> Optional[bytes]:
+    async def generate_audio_simple(self, text: str, voice_id: str, voice_engine: str = "s1", audio_format: str = "mp3") -> Optional[bytes]:
         """
         Generate audio using simple HTTP request (faster, more reliable than websocket).
         
@@ -47,6 +60,7 @@ class TTSService:
             text: Text to convert to speech
             voice_id: Voice ID from persona config
             voice_engine: Voice engine/backend (default: "s1")
+            audio_format: Output format, one of AUDIO_MEDIA_TYPES (default: "mp3")
         
         Returns:
             bytes: Audio data or None if error
@@ -59,7 +73,6 @@ class TTSService:
         
         try:
             import httpx
-            from utils.text_cleaner import clean_text_for_tts
             
             cleaned_text = clean_text_for_tts(text)
             logger.info(f"[TTS] Generating audio via HTTP (voice_id: {voice_id}, backend: {voice_engine})")
@@ -77,7 +90,7 @@ class TTSService:
             payload = {
                 "text": cleaned_text,
                 "reference_id": voice_id,
-                "format": "mp3",
+                "format": audio_format,
                 "backend": voice_engine
             }
             
@@ -96,7 +109,7 @@ class TTSService:
             logger.error(f"Error generating audio via HTTP: {e}", exc_info=True)
             return None
     
-    async def generate_audio_stream(self, text_stream, voice_id: str, voice_engine: str = "s1"):
+    async def generate_audio_stream(self, text_stream, voice_id: str, voice_engine: str = "s1", audio_format: str = "mp3"):
         """
         Generate audio from streaming text using Fish Audio API.
         Collects text by sentences and generates audio chunks.
@@ -106,6 +119,7 @@ class TTSService:
             text_stream: Async generator that yields text chunks
             voice_id: Voice ID from persona config
             voice_engine: Voice engine/backend (default: "s1")
+            audio_format: Output format, one of AUDIO_MEDIA_TYPES (default: "mp3")
         
         Yields:
             bytes: Audio chunks as they are generated
@@ -151,7 +165,7 @@ class TTSService:
                         
                         # Generate audio using simple HTTP method (more reliable)
                         # Note: generate_audio_simple also calls clean_text_for_tts internally, but we log here first
-                        audio_bytes = await self.generate_audio_simple(text_to_generate, voice_id, voice_engine)
+                        audio_bytes = await self.generate_audio_simple(text_to_generate, voice_id, voice_engine, audio_format)
                         if audio_bytes:
                             logger.info(f"[TTS STREAM] Generated {len(audio_bytes)} bytes of audio")
                             yield audio_bytes
@@ -166,7 +180,7 @@ class TTSService:
                 if "'" not in cleaned_final and "'" not in cleaned_final:
                     logger.info(f"[TTS STREAM] ✓ No apostrophes in final cleaned chunk sent to Fish Audio")
                 
-                audio_bytes = await self.generate_audio_simple(final_text, voice_id, voice_engine)
+                audio_bytes = await self.generate_audio_simple(final_text, voice_id, voice_engine, audio_format)
                 if audio_bytes:
                     logger.info(f"[TTS STREAM] Generated final {len(audio_bytes)} bytes of audio")
                     yield audio_bytes
@@ -174,7 +188,7 @@ class TTSService:
         except Exception as e:
             logger.error(f"Error in streaming TTS: {e}", exc_info=True)
     
-    async def generate_audio(self, text: str, voice_id: str, voice_engine: str = "s1", save_to_file: bool = True) -> tuple[Optional[bytes], Optional[str]]:
+    async def generate_audio(self, text: str, voice_id: str, voice_engine: str = "s1", save_to_file: bool = True, audio_format: str = "mp3") -> tuple[Optional[bytes], Optional[str]]:
         """
         Generate audio from text using Fish Audio API SDK.
         
@@ -183,6 +197,8 @@ class TTSService:
             voice_id: Voice ID (reference_id) from persona config
             voice_engine: Voice engine/backend (default: "s1")
             save_to_file: Whether to save the audio file
+            audio_format: Output format, one of AUDIO_MEDIA_TYPES (default: "mp3").
+                Saved files use the format as their extension.
         
         Returns:
             Tuple of (audio bytes or None, filepath or None if error)
@@ -204,7 +220,7 @@ class TTSService:
                 request = TTSRequest(
                     text="",  # Empty - text comes only from text_stream
                     reference_id=voice_id,
-                    format="mp3"
+                    format=audio_format
                 )
                 
                 # Create async generator that yields the text once
@@ -228,8 +244,7 @@ class TTSService:
                             audio_dir = self._get_audio_directory()
                             audio_dir.mkdir(parents=True, exist_ok=True)
                             
-                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-                            filename = f"tts_{timestamp}.mp3"
+                            filename = f"tts_{time.time_ns()}_{next(_file_counter)}.{audio_format}"
                             filepath = audio_dir / filename
                             
                             with open(filepath, 'wb') as f:
@@ -1,22 +1,165 @@
 """Video file converter service for converting MKV/AVI to MP4."""
+import contextlib
+import json
 import logging
+import os
+import sqlite3
 import subprocess
 import asyncio
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 import multiprocessing
 
+try:
+    import psutil
+except ImportError:  # Optional: adaptive concurrency falls back to the load average
+    psutil = None
+
 logger = logging.getLogger(__name__)
 
 # Source formats to convert
 SOURCE_FORMATS = {'.mkv', '.avi'}
+# Same set as a tuple for str.endswith, matched against the lowercased name
+SOURCE_SUFFIXES = tuple(SOURCE_FORMATS)
 TARGET_FORMAT = '.mp4'
+# In-progress output suffix; renamed to TARGET_FORMAT only once ffmpeg succeeds
+PARTIAL_SUFFIX = '.part'
+
+# Sources smaller than this (failed/empty downloads) are skipped at scan time
+MIN_SOURCE_SIZE = 1024
+
+# Audio codecs the MP4 container can carry as-is (stream copy, no re-encode)
+MP4_COPY_AUDIO_CODECS = {'aac', 'ac3', 'eac3', 'mp3'}
+
+# Copyable audio codecs that older ffmpeg mp4 muxers only accept with -strict experimental
+MP4_STRICT_AUDIO_CODECS = {'ac3', 'eac3'}
+
+# Video codecs the MP4 container can carry as-is; anything else is re-encoded
+MP4_COPY_VIDEO_CODECS = {'h264', 'hevc', 'mpeg4', 'mpeg2video', 'mpeg1video', 'av1', 'vp9'}
+
+# H.264 encoders in order of preference, with their fastest-preset args
+VIDEO_ENCODER_ARGS = {
+    'h264_nvenc': ['-preset', 'p1'],
+    'h264_qsv': ['-preset', 'veryfast'],
+    'h264_videotoolbox': ['-realtime', '1'],
+    'libx264': ['-preset', 'ultrafast'],
+}
+
+# On-disk cache of ffprobe results, so repeat scans/conversions skip the probe
+META_CACHE_PATH = Path(__file__).parent.parent / "data" / "cache" / "video_meta.db"
+
+# Concurrent h264_nvenc encodes allowed (consumer GPU driver session limit)
+NVENC_MAX_SESSIONS = 2
+
+# Per-stream codec args, picked by table lookup from the probed codecs
+COPY_VIDEO_ARGS = ('-c:v', 'copy')
+COPY_AUDIO_ARGS = ('-c:a', 'copy')
+COPY_STRICT_AUDIO_ARGS = ('-c:a', 'copy', '-strict', 'experimental')
+AAC_AUDIO_ARGS = ('-c:a', 'aac', '-b:a', '192k')
+
+# Input options that skip ffmpeg's own stream probing (ffprobe already ran); a
+# conversion that fails with them is retried once without
+FAST_PROBE_INPUT_ARGS = ('-analyzeduration', '0', '-probesize', '32', '-fflags', '+genpts')
+
+# Map exactly the first video and audio stream (the ones ffprobe described), rather
+# than relying on ffmpeg's default selection after the shortened input probe
+STREAM_MAP_ARGS = ('-map', '0:v:0?', '-map', '0:a:0?')
+
+# A converted file may differ from the source's duration by this much (seconds, or
+# this fraction of the duration if larger) before it is rejected
+OUTPUT_DURATION_TOLERANCE_S = 2.0
+OUTPUT_DURATION_TOLERANCE_RATIO = 0.01
+
+# Output options shared by every conversion; only the codec args and paths vary per file
+FFMPEG_MP4_OUTPUT_ARGS = (
+    '-movflags', '+faststart',  # Optimize for web playback
+    '-threads', '0',  # Use all available threads per conversion
+    '-map_metadata', '-1',  # Strip metadata (faster)
+    '-avoid_negative_ts', 'make_zero',  # Handle timestamp issues
+    '-loglevel', 'error',  # Only show errors
+    '-y',  # Overwrite if exists
+    '-f', 'mp4',  # Explicit muxer: the .part name doesn't imply one
+)
+
+# Seconds a cancelled ffmpeg gets to exit after SIGTERM before it is killed
+FFMPEG_TERMINATE_TIMEOUT_S = 5
+
+# Minimum seconds between per-file progress events
+PROGRESS_INTERVAL_S = 0.5
+
+# Events buffered for a slow streaming client before old progress updates are dropped
+STREAM_EVENT_BUFFER_SIZE = 256
 
 # Number of concurrent conversions (use all CPU cores for maximum speed)
 # FFmpeg handles its own threading, so we can run multiple conversions in parallel
 MAX_CONCURRENT_CONVERSIONS = max(1, multiprocessing.cpu_count())
 
+# Ceiling for adaptive concurrency: stream-copy remuxes are IO-bound and can
+# usefully run well past one per core
+MAX_ADAPTIVE_CONVERSIONS = min(32, MAX_CONCURRENT_CONVERSIONS * 4)
+
+# Re-check CPU/IO saturation after this many finished files
+CONCURRENCY_SAMPLE_EVERY = 4
+
+
+@lru_cache(maxsize=1)
+def _detect_video_encoder() -> str:
+    """
+    Pick the first hardware H.264 encoder that ffmpeg can actually open.
+    
+    Being listed by `ffmpeg -encoders` only means support was compiled in, so
+    each candidate is checked with a tiny test encode. Falls back to libx264.
+    """
+    try:
+        listing = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-encoders'],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, timeout=10
+        ).stdout.decode('utf-8', errors='ignore')
+    except Exception as e:
+        logger.warning(f"Could not list ffmpeg encoders: {e}")
+        return 'libx264'
+    
+    for encoder in VIDEO_ENCODER_ARGS:
+        if encoder == 'libx264' or encoder not in listing:
+            continue
+        try:
+            probe = subprocess.run(
+                ['ffmpeg', '-hide_banner', '-loglevel', 'error',
+                 '-f', 'lavfi', '-i', 'nullsrc=s=256x256:d=0.1',
+                 '-c:v', encoder, '-f', 'null', '-'],
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10
+            )
+            if probe.returncode == 0:
+                return encoder
+        except Exception:
+            continue
+    
+    return 'libx264'
+
+
+def _sample_load() -> Optional[Tuple[float, float]]:
+    """
+    Return (busy CPU %, IO wait %) since the previous call, or None if unknown.
+    
+    Uses psutil when installed; otherwise approximates busy CPU from the
+    1-minute load average with no IO wait figure.
+    """
+    if psutil is not None:
+        times = psutil.cpu_times_percent(interval=None)
+        iowait = getattr(times, 'iowait', 0.0)  # Linux only
+        return 100.0 - times.idle - iowait, iowait
+    try:
+        load_1m = os.getloadavg()[0]
+    except (AttributeError, OSError):  # Windows
+        return None
+    return min(100.0, load_1m / MAX_CONCURRENT_CONVERSIONS * 100), 0.0
+
 
 class VideoConverter:
     """Service for converting video files to MP4 format with parallel processing."""
@@ -27,23 +170,37 @@ class VideoConverter:
         
         Args:
             video_directory: Path to video directory
-            max_concurrent: Maximum concurrent conversions (defaults to CPU count - 1)
+            max_concurrent: Maximum concurrent conversions. When omitted, starts at
+                the CPU count and adapts to CPU/IO load up to MAX_ADAPTIVE_CONVERSIONS
         """
         self.video_directory = Path(video_directory)
         self.movies_dir = self.video_directory / "Movies"
         self.tv_dir = self.video_directory / "Tv"
         
-        # Set concurrency limit
+        # Set concurrency limit (an explicit limit is honoured as-is)
         self.max_concurrent = max_concurrent or MAX_CONCURRENT_CONVERSIONS
+        self.adaptive_concurrency = max_concurrent is None
+        self._worker_ceiling = MAX_ADAPTIVE_CONVERSIONS if self.adaptive_concurrency else self.max_concurrent
         
-        # Track conversion progress (thread-safe with asyncio)
+        # Track conversion progress (only mutated between awaits, so no lock is needed)
         self.total_files = 0
         self.converted_files = 0
         self.failed_files = 0
+        self.skipped_files = 0  # Sources whose MP4 already exists (filtered at scan time)
+        self._file_sizes: Dict[Path, int] = {}  # Source sizes from the last scan
         self.current_files = set()  # Currently processing files
         self.errors = []
-        # Lock will be created lazily in async context when needed
-        self._lock = None
+        # ffmpeg/ffprobe are spawned and awaited from worker threads so process
+        # setup for concurrent conversions isn't serialized on the event loop
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(self._worker_ceiling, self.max_concurrent) + 2,
+            thread_name_prefix="video-converter"
+        )
+        # Cache of ffprobe'd stream codecs per source path
+        self._media_info: Dict[Path, Dict[str, Any]] = {}
+        # Encoder used when the video stream can't be copied (detected on first need)
+        self._video_encoder: Optional[str] = None
+        self._nvenc_semaphore = asyncio.Semaphore(NVENC_MAX_SESSIONS)
         
     async def convert_all(self) -> Dict[str, Any]:
         """
@@ -68,21 +225,25 @@ class VideoConverter:
         
         # Scan for files to convert
         files_to_convert = []
+        self.skipped_files = 0
         
         if self.movies_dir.exists():
             logger.info(f"\n📁 Scanning Movies directory...")
-            movie_files = self._scan_directory(self.movies_dir)
+            movie_files = await asyncio.to_thread(self._scan_directory, self.movies_dir)
             files_to_convert.extend(movie_files)
             logger.info(f"   Found {len(movie_files)} files to convert")
         
         if self.tv_dir.exists():
             logger.info(f"\n📁 Scanning TV directory...")
-            tv_files = self._scan_directory(self.tv_dir, recursive=True)
+            tv_files = await asyncio.to_thread(self._scan_directory, self.tv_dir, True)
             files_to_convert.extend(tv_files)
             logger.info(f"   Found {len(tv_files)} files to convert")
         
         results["total_files"] = len(files_to_convert)
+        results["skipped"] = self.skipped_files
         self.total_files = len(files_to_convert)
+        if self.skipped_files:
+            logger.info(f"   Skipped {self.skipped_files} files already converted")
         
         if not files_to_convert:
             logger.info("\n✓ No files need conversion")
@@ -91,60 +252,34 @@ class VideoConverter:
         logger.info(f"\n🔄 Converting {len(files_to_convert)} files in batches of {self.max_concurrent}...")
         logger.info("="*80)
         
-        # Create semaphore to limit concurrent conversions
-        semaphore = asyncio.Semaphore(self.max_concurrent)
-        
-        # Create lock if not exists (lazy initialization in async context)
-        if self._lock is None:
-            self._lock = asyncio.Lock()
-        
-        # Convert files concurrently with semaphore
-        async def convert_with_semaphore(file_path: Path, index: int):
-            async with semaphore:
-                try:
-                    async with self._lock:
-                        self.current_files.add(file_path.name)
-                    
-                    logger.info(f"\n[{index}/{len(files_to_convert)}] 🔄 Starting: {file_path.name}")
-                    success = await self._convert_file(file_path, index, len(files_to_convert))
-                    
-                    async with self._lock:
-                        self.current_files.discard(file_path.name)
-                        if success:
-                            self.converted_files += 1
-                        else:
-                            self.failed_files += 1
-                    
-                    return success
-                    
-                except Exception as e:
-                    error_msg = f"Error converting {file_path.name}: {str(e)}"
-                    logger.error(f"  ❌ {error_msg}")
-                    
-                    async with self._lock:
-                        self.current_files.discard(file_path.name)
-                        self.errors.append(error_msg)
-                        self.failed_files += 1
-                    
-                    return False
-        
-        # Run all conversions concurrently
-        conversion_tasks = [
-            convert_with_semaphore(file_path, idx)
-            for idx, file_path in enumerate(files_to_convert, 1)
-        ]
-        
-        conversion_results = await asyncio.gather(*conversion_tasks, return_exceptions=True)
+        total = len(files_to_convert)
         
-        # Count results
-        for result in conversion_results:
-            if isinstance(result, Exception):
-                results["failed"] += 1
-                results["errors"].append(str(result))
-            elif result:
-                results["converted"] += 1
-            else:
+        async def convert_one(file_path: Path, index: int):
+            try:
+                self.current_files.add(file_path.name)
+                
+                logger.info("\n[%d/%d] 🔄 Starting: %s", index, total, file_path.name)
+                success = await self._convert_file(file_path, index, total)
+                
+                self.current_files.discard(file_path.name)
+                if success:
+                    self.converted_files += 1
+                    results["converted"] += 1
+                else:
+                    self.failed_files += 1
+                    results["failed"] += 1
+                
+            except Exception as e:
+                error_msg = f"Error converting {file_path.name}: {str(e)}"
+                logger.error(f"  ❌ {error_msg}")
+                
+                self.current_files.discard(file_path.name)
+                self.errors.append(error_msg)
+                self.failed_files += 1
                 results["failed"] += 1
+                results["errors"].append(error_msg)
+        
+        await self._run_workers(files_to_convert, convert_one)
         
         logger.info("\n" + "="*80)
         logger.info(f"✓ CONVERSION COMPLETE")
@@ -157,40 +292,332 @@ class VideoConverter:
         self.current_files.clear()
         return results
     
+    async def _run_workers(
+        self,
+        files: List[Path],
+        handle: Callable[[Path, int], Awaitable[None]]
+    ) -> None:
+        """
+        Call handle(file_path, index) for every file on a bounded set of workers.
+        
+        Workers pull from a bounded queue, so only max_concurrent conversions are
+        in flight however large the library is. With adaptive concurrency that
+        limit is re-tuned from CPU/IO load every CONCURRENCY_SAMPLE_EVERY files.
+        A failing file is logged and does not stop its worker. Cancelling the
+        caller cancels every worker, and each in-flight conversion terminates
+        its ffmpeg child and removes its partial outputs before the
+        cancellation completes.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._worker_ceiling * 2)
+        worker_count = min(self._worker_ceiling, len(files))
+        slot_freed = asyncio.Condition()
+        active = 0
+        finished = 0
+        if self.adaptive_concurrency:
+            _sample_load()  # Prime psutil's interval counters
+        
+        async def worker():
+            nonlocal active, finished
+            while True:
+                async with slot_freed:
+                    await slot_freed.wait_for(lambda: active < self.max_concurrent)
+                    active += 1
+                try:
+                    item = await queue.get()
+                    if item is None:
+                        return
+                    index, file_path = item
+                    try:
+                        await handle(file_path, index)
+                    except Exception as e:
+                        logger.error("  ❌ Error converting %s: %s", file_path.name, e)
+                    finished += 1
+                    if self.adaptive_concurrency and finished % CONCURRENCY_SAMPLE_EVERY == 0:
+                        self._adjust_concurrency()
+                finally:
+                    async with slot_freed:
+                        active -= 1
+                        slot_freed.notify_all()
+        
+        async def feed():
+            for item in enumerate(files, 1):
+                await queue.put(item)
+            for _ in range(worker_count):
+                await queue.put(None)
+        
+        if hasattr(asyncio, "TaskGroup"):
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(worker_count):
+                    tg.create_task(worker())
+                await feed()
+        else:
+            # Python < 3.11
+            workers = [asyncio.create_task(worker()) for _ in range(worker_count)]
+            try:
+                await feed()
+                await asyncio.gather(*workers)
+            finally:
+                for worker_task in workers:
+                    worker_task.cancel()
+    
+    def _adjust_concurrency(self) -> None:
+        """Grow the conversion limit while CPU and disk have headroom, shrink it when saturated."""
+        load = _sample_load()
+        if load is None:
+            return
+        busy, iowait = load
+        if (busy > 90 or iowait > 30) and self.max_concurrent > 1:
+            self.max_concurrent -= 1
+        elif busy < 60 and iowait < 10 and self.max_concurrent < self._worker_ceiling:
+            self.max_concurrent += 1
+        else:
+            return
+        logger.debug("Conversion concurrency -> %d (cpu %.0f%%, iowait %.0f%%)", self.max_concurrent, busy, iowait)
+    
     def _scan_directory(self, directory: Path, recursive: bool = False) -> List[Path]:
-        """Scan directory for files that need conversion."""
+        """
+        Scan directory for files that need conversion.
+        
+        Files whose MP4 already sits next to them are left out and counted in
+        self.skipped_files instead.
+        """
         files = []
+        # Iterative os.scandir walk: DirEntry type checks reuse readdir data, and
+        # only matching files are wrapped in Path objects
+        pending = [str(directory)]
         
-        if recursive:
-            # Recursively scan subdirectories for TV shows
-            for item in directory.rglob('*'):
-                try:
-                    # Skip macOS resource fork files (._filename) - these should be deleted, not converted
-                    if item.name.startswith('._'):
-                        continue
-                    # Skip if we can't access the file (I/O errors, broken symlinks, etc.)
-                    if item.is_file() and item.suffix.lower() in SOURCE_FORMATS:
-                        files.append(item)
-                except (OSError, PermissionError) as e:
-                    logger.warning(f"  ⚠️  Skipping inaccessible file: {item} - {e}")
+        while pending:
+            current = pending.pop()
+            names = set()
+            candidates = []
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        names.add(entry.name)
+                        try:
+                            # Skip macOS resource fork files (._filename) - these should be deleted, not converted
+                            if entry.name.startswith('._'):
+                                continue
+                            if recursive and entry.is_dir(follow_symlinks=False):
+                                # Recursively scan subdirectories for TV shows
+                                pending.append(entry.path)
+                            elif entry.name.lower().endswith(SOURCE_SUFFIXES) and entry.is_file():
+                                candidates.append(entry)
+                        except (OSError, PermissionError) as e:
+                            # Skip if we can't access the file (I/O errors, broken symlinks, etc.)
+                            logger.warning("  ⚠️  Skipping inaccessible file: %s - %s", entry.path, e)
+                            continue
+            except (OSError, PermissionError) as e:
+                if current == str(directory):
+                    raise
+                logger.warning("  ⚠️  Skipping inaccessible directory: %s - %s", current, e)
+                continue
+            
+            for entry in candidates:
+                # Already converted if the MP4 is in the same listing (no extra syscalls)
+                if entry.name.rpartition('.')[0] + TARGET_FORMAT in names:
+                    self.skipped_files += 1
                     continue
-        else:
-            # Only scan top level for movies
-            for item in directory.iterdir():
+                # Empty/truncated downloads would only spawn ffmpeg to fail
                 try:
-                    # Skip macOS resource fork files (._filename) - these should be deleted, not converted
-                    if item.name.startswith('._'):
-                        continue
-                    # Skip if we can't access the file (I/O errors, broken symlinks, etc.)
-                    if item.is_file() and item.suffix.lower() in SOURCE_FORMATS:
-                        files.append(item)
+                    size = entry.stat().st_size
                 except (OSError, PermissionError) as e:
-                    logger.warning(f"  ⚠️  Skipping inaccessible file: {item} - {e}")
+                    logger.warning("  ⚠️  Skipping inaccessible file: %s - %s", entry.path, e)
+                    continue
+                if size < MIN_SOURCE_SIZE:
+                    logger.info("  ⚠️  Skipping empty file (%d bytes): %s", size, entry.path)
                     continue
+                file_path = Path(entry.path)
+                self._file_sizes[file_path] = size
+                files.append(file_path)
         
         return files
     
-    async def _convert_file(self, source_path: Path, index: int = 0, total: int = 0) -> bool:
+    async def _probe_media(self, source_path: Path) -> Dict[str, Any]:
+        """
+        Return the first video/audio codec names and the duration in seconds.
+        
+        Results are cached in memory per path and on disk keyed on the file's
+        mtime and size. Values are None if the stream is missing or ffprobe
+        is unavailable.
+        """
+        if source_path in self._media_info:
+            return self._media_info[source_path]
+        
+        loop = asyncio.get_running_loop()
+        info = await loop.run_in_executor(self._executor, self._probe_media_sync, source_path)
+        self._media_info[source_path] = info
+        return info
+    
+    def _probe_media_sync(self, source_path: Path) -> Dict[str, Any]:
+        """Look up media info in the on-disk cache, running ffprobe on a miss (runs in a worker thread)."""
+        info: Dict[str, Any] = {"video_codec": None, "audio_codec": None, "duration": None}
+        try:
+            st = source_path.stat()
+        except OSError as e:
+            logger.warning("  ⚠️  Could not probe %s: %s", source_path.name, e)
+            return info
+        
+        cached = self._read_meta_cache(source_path, st)
+        if cached is not None:
+            return cached
+        
+        cmd = [
+            'ffprobe',
+            '-v', 'error',
+            '-show_entries', 'stream=codec_type,codec_name:format=duration',
+            '-of', 'json',
+            str(source_path)
+        ]
+        try:
+            process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            if process.returncode != 0:
+                return info
+            probe = json.loads(process.stdout or b"{}")
+            for stream in probe.get("streams", []):
+                key = f"{stream.get('codec_type')}_codec"
+                if key in info and info[key] is None:
+                    info[key] = (stream.get("codec_name") or "").lower() or None
+            duration = probe.get("format", {}).get("duration")
+            if duration:
+                info["duration"] = float(duration)
+        except Exception as e:
+            logger.warning("  ⚠️  Could not probe %s: %s", source_path.name, e)
+            return info
+        
+        self._write_meta_cache(source_path, st, info)
+        return info
+    
+    async def _output_matches_source(self, output_path: Path, media_info: Dict[str, Any]) -> bool:
+        """Check a converted file has the source's video/audio streams and duration."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._output_matches_source_sync, output_path, media_info
+        )
+    
+    def _output_matches_source_sync(self, output_path: Path, media_info: Dict[str, Any]) -> bool:
+        """ffprobe a converted file and compare it with the source's media info (runs in a worker thread)."""
+        expected_types = {t for t in ("video", "audio") if media_info[f"{t}_codec"]}
+        source_duration = media_info["duration"]
+        if not expected_types and not source_duration:
+            return True  # Source couldn't be probed; nothing to compare against
+        
+        cmd = [
+            'ffprobe',
+            '-v', 'error',
+            '-show_entries', 'stream=codec_type:format=duration',
+            '-of', 'json',
+            str(output_path)
+        ]
+        try:
+            process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+            if process.returncode != 0:
+                return False
+            probe = json.loads(process.stdout or b"{}")
+        except Exception as e:
+            logger.warning("  ⚠️  Could not verify %s: %s", output_path.name, e)
+            return False
+        
+        output_types = {stream.get("codec_type") for stream in probe.get("streams", [])}
+        if not expected_types <= output_types:
+            logger.warning("  ⚠️  %s is missing %s stream(s)", output_path.name, ", ".join(sorted(expected_types - output_types)))
+            return False
+        if source_duration:
+            try:
+                output_duration = float(probe.get("format", {}).get("duration"))
+            except (TypeError, ValueError):
+                return False
+            tolerance = max(OUTPUT_DURATION_TOLERANCE_S, source_duration * OUTPUT_DURATION_TOLERANCE_RATIO)
+            if abs(output_duration - source_duration) > tolerance:
+                logger.warning(
+                    "  ⚠️  %s duration %.1fs doesn't match source %.1fs",
+                    output_path.name, output_duration, source_duration
+                )
+                return False
+        return True
+    
+    def _connect_meta_cache(self) -> sqlite3.Connection:
+        """Open the ffprobe metadata cache, creating it if needed."""
+        META_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(META_CACHE_PATH, timeout=5)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS media_info ("
+            "path TEXT PRIMARY KEY, mtime REAL, size INTEGER, "
+            "audio TEXT, video TEXT, duration REAL)"
+        )
+        return conn
+    
+    def _read_meta_cache(self, source_path: Path, st: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Return cached media info if the file is unchanged since it was probed."""
+        try:
+            conn = self._connect_meta_cache()
+            try:
+                row = conn.execute(
+                    "SELECT audio, video, duration FROM media_info WHERE path = ? AND mtime = ? AND size = ?",
+                    (str(source_path), st.st_mtime, st.st_size)
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug("Video metadata cache read failed: %s", e)
+            return None
+        
+        if row is None:
+            return None
+        return {"audio_codec": row[0], "video_codec": row[1], "duration": row[2]}
+    
+    def _write_meta_cache(self, source_path: Path, st: os.stat_result, info: Dict[str, Any]) -> None:
+        """Store probed media info for the file's current mtime and size."""
+        try:
+            conn = self._connect_meta_cache()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO media_info (path, mtime, size, audio, video, duration) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (str(source_path), st.st_mtime, st.st_size,
+                         info["audio_codec"], info["video_codec"], info["duration"])
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug("Video metadata cache write failed: %s", e)
+    
+    async def _get_video_encoder_args(self) -> List[str]:
+        """Return ffmpeg video encoder args, preferring a working hardware encoder."""
+        if self._video_encoder is None:
+            loop = asyncio.get_running_loop()
+            self._video_encoder = await loop.run_in_executor(self._executor, _detect_video_encoder)
+            logger.info(f"  🎞️  Video encoder for re-encodes: {self._video_encoder}")
+        return ['-c:v', self._video_encoder, *VIDEO_ENCODER_ARGS[self._video_encoder]]
+    
+    @staticmethod
+    def _wait_with_progress(process: subprocess.Popen, duration: float, report: Callable[[int], None]) -> int:
+        """Drain ffmpeg's -progress output until exit, reporting percent complete (runs in a worker thread)."""
+        last_report = 0.0
+        for line in process.stdout:
+            if not line.startswith(b'out_time_us='):
+                continue
+            now = time.monotonic()
+            if now - last_report < PROGRESS_INTERVAL_S:
+                continue
+            try:
+                out_time_s = int(line[12:]) / 1_000_000
+            except ValueError:
+                continue  # "N/A" before the first frame
+            last_report = now
+            report(min(100, int(out_time_s / duration * 100)))
+        process.stdout.close()
+        return process.wait()
+    
+    async def _convert_file(
+        self,
+        source_path: Path,
+        index: int = 0,
+        total: int = 0,
+        extra_outputs: Optional[List[Tuple[Path, List[str]]]] = None,
+        on_progress: Optional[Callable[[int], None]] = None
+    ) -> bool:
         """
         Convert a single video file to MP4 (optimized for speed).
         
@@ -198,13 +625,17 @@ class VideoConverter:
             source_path: Path to source video file
             index: Current file index (for logging)
             total: Total files (for logging)
+            extra_outputs: Additional (output path, ffmpeg output options) variants
+                produced by the same ffmpeg run, so the source is read only once
+            on_progress: Called on the event loop with the percent complete
+                (at most every PROGRESS_INTERVAL_S) while ffmpeg runs
             
         Returns:
             True if conversion successful, False otherwise
         """
         # Skip macOS resource fork files - these should not be converted
         if source_path.name.startswith('._'):
-            logger.info(f"  [{index}/{total}] ⚠️  {source_path.name}: Skipping macOS resource fork file")
+            logger.info("  [%d/%d] ⚠️  %s: Skipping macOS resource fork file", index, total, source_path.name)
             return False
         
         # Generate output path
@@ -212,86 +643,190 @@ class VideoConverter:
         
         # Skip if output already exists
         if output_path.exists():
-            logger.info(f"  [{index}/{total}] ⚠️  {source_path.name}: MP4 already exists, skipping")
+            logger.info("  [%d/%d] ⚠️  %s: MP4 already exists, skipping", index, total, source_path.name)
             return True
         
-        logger.info(f"  [{index}/{total}] 🔄 Converting: {source_path.name}")
+        logger.info("  [%d/%d] 🔄 Converting: %s", index, total, source_path.name)
+        
+        # Copy streams when MP4 can hold them as-is, turning the job into a pure remux
+        media_info = await self._probe_media(source_path)
+        video_codec = media_info["video_codec"]
+        if video_codec is None or video_codec in MP4_COPY_VIDEO_CODECS:
+            video_args = COPY_VIDEO_ARGS
+        else:
+            video_args = await self._get_video_encoder_args()
+        audio_codec = media_info["audio_codec"]
+        if audio_codec in MP4_STRICT_AUDIO_CODECS:
+            audio_args = COPY_STRICT_AUDIO_ARGS
+        elif audio_codec in MP4_COPY_AUDIO_CODECS:
+            audio_args = COPY_AUDIO_ARGS
+        else:
+            audio_args = AAC_AUDIO_ARGS
+        
+        # Write to a .part file and rename on success, so an interrupted run never
+        # leaves a truncated MP4 that later scans would treat as converted
+        partial_path = output_path.with_name(output_path.name + PARTIAL_SUFFIX)
         
         # Build ffmpeg command (optimized for maximum speed)
         # -i: input file
-        # -c:v copy: copy video stream (FAST - no re-encoding!)
-        # -c:a aac: convert audio to AAC (MP4 compatible)
-        # -b:a 192k: audio bitrate
-        # -movflags +faststart: optimize for streaming
-        # -threads 0: use all available CPU threads per conversion
-        # -preset ultrafast: fastest encoding (for audio conversion)
-        # -loglevel error: suppress verbose output
-        # -y: overwrite output file if exists
-        # -map_metadata -1: strip metadata for faster processing
-        # -avoid_negative_ts make_zero: handle timestamp issues
+        # -c:v copy: copy video stream (FAST - no re-encoding!); codecs MP4 can't
+        #   hold are re-encoded with a hardware H.264 encoder when available
+        # -c:a copy|aac: copy compatible audio (AC3/E-AC3 included), otherwise convert to AAC at 192k
+        # STREAM_MAP_ARGS: the first video/audio streams, i.e. the ones ffprobe reported
+        # FFMPEG_MP4_OUTPUT_ARGS: the fixed faststart/threads/metadata/muxer options
         cmd = [
             'ffmpeg',
             '-i', str(source_path),
-            '-c:v', 'copy',  # Copy video (FAST, no quality loss)
-            '-c:a', 'aac',   # Convert audio to AAC
-            '-b:a', '192k',  # Audio bitrate
-            '-movflags', '+faststart',  # Optimize for web playback
-            '-threads', '0',  # Use all available threads per conversion
-            '-preset', 'ultrafast',  # Fastest encoding preset
-            '-map_metadata', '-1',  # Strip metadata (faster)
-            '-avoid_negative_ts', 'make_zero',  # Handle timestamp issues
-            '-loglevel', 'error',  # Only show errors
-            '-y',  # Overwrite if exists
-            str(output_path)
+            *STREAM_MAP_ARGS,
+            *video_args,
+            *audio_args,
+            *FFMPEG_MP4_OUTPUT_ARGS,
+            str(partial_path)
         ]
+        duration = media_info["duration"]
+        if on_progress is not None and duration:
+            # Machine-readable key=value progress on stdout instead of stderr stats
+            cmd[1:1] = ['-progress', 'pipe:1', '-nostats']
+        else:
+            on_progress = None
+        for extra_path, extra_options in extra_outputs or []:
+            cmd.extend([*extra_options, str(extra_path)])
+        written_paths = [partial_path, *(extra_path for extra_path, _ in extra_outputs or [])]
         
         try:
-            # Run conversion
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+            # Consumer NVIDIA drivers cap concurrent NVENC sessions; stream copies bypass this
+            uses_nvenc = video_args[1] == 'h264_nvenc'
+            returncode, error_output = await self._run_ffmpeg(
+                ['ffmpeg', *FAST_PROBE_INPUT_ARGS, *cmd[1:]], duration, on_progress, uses_nvenc
             )
+            verified = returncode == 0 and await self._output_matches_source(partial_path, media_info)
+            if not verified:
+                # A few sources need deeper probing than the fast-start flags allow
+                logger.info("  [%d/%d] 🔁 %s: Retrying with full input probing", index, total, source_path.name)
+                returncode, error_output = await self._run_ffmpeg(cmd, duration, on_progress, uses_nvenc)
+                verified = returncode == 0 and await self._output_matches_source(partial_path, media_info)
             
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode == 0:
-                # Verify output file was created
-                if output_path.exists() and output_path.stat().st_size > 0:
-                    # Get file sizes
-                    original_size = source_path.stat().st_size / (1024 * 1024)  # MB
-                    new_size = output_path.stat().st_size / (1024 * 1024)  # MB
-                    size_diff = ((new_size - original_size) / original_size * 100) if original_size > 0 else 0
+            if returncode == 0:
+                # Verify every output file was created, and the MP4 kept the source's
+                # streams and length, before the original is deleted
+                if verified and all(path.exists() and path.stat().st_size > 0 for path in written_paths):
+                    os.replace(partial_path, output_path)
                     
-                    logger.info(f"  [{index}/{total}] ✅ {source_path.name}: {original_size:.1f}MB → {new_size:.1f}MB ({size_diff:+.1f}%)")
+                    # Size summary costs two stat() calls, so only gather it when it will be logged
+                    if logger.isEnabledFor(logging.INFO):
+                        original_size = source_path.stat().st_size / (1024 * 1024)  # MB
+                        new_size = output_path.stat().st_size / (1024 * 1024)  # MB
+                        size_diff = ((new_size - original_size) / original_size * 100) if original_size > 0 else 0
+                        
+                        logger.info("  [%d/%d] ✅ %s: %.1fMB → %.1fMB (%+.1f%%)", index, total, source_path.name, original_size, new_size, size_diff)
                     
                     # Delete original file
                     source_path.unlink()
-                    logger.info(f"  [{index}/{total}] 🗑️  Deleted original: {source_path.name}")
+                    logger.info("  [%d/%d] 🗑️  Deleted original: %s", index, total, source_path.name)
                     
                     return True
                 else:
-                    logger.error(f"  [{index}/{total}] ❌ {source_path.name}: Output file not created or empty")
+                    logger.error("  [%d/%d] ❌ %s: Output file not created, empty or missing streams", index, total, source_path.name)
+                    self._remove_outputs(written_paths)
                     return False
             else:
-                error_output = stderr.decode('utf-8', errors='ignore')
-                logger.error(f"  [{index}/{total}] ❌ {source_path.name}: Conversion failed - {error_output[:200]}")
+                logger.error("  [%d/%d] ❌ %s: Conversion failed - %.200s", index, total, source_path.name, error_output)
                 
-                # Clean up failed output file
-                if output_path.exists():
-                    output_path.unlink()
+                # Clean up failed output files
+                self._remove_outputs(written_paths)
                 
                 return False
                 
+        except asyncio.CancelledError:
+            # ffmpeg has been stopped; don't leave its partial outputs behind
+            logger.info("  [%d/%d] ⏹️  %s: Conversion cancelled", index, total, source_path.name)
+            self._remove_outputs(written_paths)
+            raise
         except Exception as e:
-            logger.error(f"  [{index}/{total}] ❌ {source_path.name}: Conversion error - {e}")
+            logger.error("  [%d/%d] ❌ %s: Conversion error - %s", index, total, source_path.name, e)
             
-            # Clean up failed output file
-            if output_path.exists():
-                output_path.unlink()
+            # Clean up failed output files
+            self._remove_outputs(written_paths)
             
             return False
     
+    async def _run_ffmpeg(
+        self,
+        cmd: List[str],
+        duration: Optional[float],
+        on_progress: Optional[Callable[[int], None]],
+        uses_nvenc: bool
+    ) -> Tuple[int, str]:
+        """
+        Run one ffmpeg command to completion.
+        
+        stderr goes to a temp file that is only read on failure, and stdout is
+        either discarded or drained continuously for progress, so a full pipe
+        can never stall the encoder.
+        
+        Returns:
+            (return code, start of stderr if it failed)
+        """
+        loop = asyncio.get_running_loop()
+        session_slot = self._nvenc_semaphore if uses_nvenc else contextlib.nullcontext()
+        async with session_slot:
+            with tempfile.TemporaryFile() as stderr_log:
+                spawn = loop.run_in_executor(
+                    self._executor,
+                    partial(
+                        subprocess.Popen,
+                        cmd,
+                        stdout=subprocess.PIPE if on_progress else subprocess.DEVNULL,
+                        stderr=stderr_log
+                    )
+                )
+                process = None
+                try:
+                    process = await asyncio.shield(spawn)
+                    if on_progress:
+                        report = partial(loop.call_soon_threadsafe, on_progress)
+                        await loop.run_in_executor(
+                            self._executor,
+                            partial(self._wait_with_progress, process, duration, report)
+                        )
+                    else:
+                        await loop.run_in_executor(self._executor, process.wait)
+                except asyncio.CancelledError:
+                    # Cancelling the await doesn't reach the child: stop ffmpeg so it
+                    # doesn't keep encoding (and holding a worker thread) on its own
+                    if process is None:
+                        process = await spawn
+                    await self._stop_process(process)
+                    raise
+                
+                error_output = ""
+                if process.returncode != 0:
+                    stderr_log.seek(0)
+                    error_output = stderr_log.read(4096).decode('utf-8', errors='ignore')
+        return process.returncode, error_output
+    
+    @staticmethod
+    async def _stop_process(process: subprocess.Popen) -> None:
+        """Terminate an ffmpeg child, killing it if it ignores SIGTERM, and wait for it to exit."""
+        if process.poll() is not None:
+            return
+        process.terminate()
+        try:
+            await asyncio.to_thread(process.wait, FFMPEG_TERMINATE_TIMEOUT_S)
+        except subprocess.TimeoutExpired:
+            logger.warning("  ⚠️  ffmpeg (pid %d) ignored SIGTERM, killing it", process.pid)
+            process.kill()
+            await asyncio.to_thread(process.wait)
+    
+    @staticmethod
+    def _remove_outputs(paths: List[Path]) -> None:
+        """Delete partial or failed output files, ignoring ones that were never written."""
+        for path in paths:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning("  ⚠️  Could not remove failed output %s: %s", path.name, e)
+    
     def get_progress(self) -> Dict[str, Any]:
         """Get current conversion progress."""
         return {
@@ -316,6 +851,7 @@ class VideoConverter:
         files_to_convert = []
         files_to_delete = []
         mac_resource_forks = []  # macOS ._ files to delete
+        self.skipped_files = 0
         
         # Scan Movies directory
         if self.movies_dir.exists():
@@ -340,27 +876,32 @@ class VideoConverter:
         
         for file_path in files_to_convert:
             try:
-                # Get file size, skip if we can't access it
-                file_size = file_path.stat().st_size
-                file_info = {
-                    "name": file_path.name,
-                    "path": str(file_path),
-                    "format": file_path.suffix.upper(),
+                # Reuse the size stat'ed during the scan; skip if we can't access it
+                file_size = self._file_sizes.get(file_path)
+                if file_size is None:
+                    file_size = file_path.stat().st_size
+                name = file_path.name
+                path_str = str(file_path)
+                file_format = file_path.suffix.upper()
+                size_mb = round(file_size / (1024 * 1024), 2)
+                convert_list.append({
+                    "name": name,
+                    "path": path_str,
+                    "format": file_format,
                     "size": file_size,
-                    "size_mb": round(file_size / (1024 * 1024), 2)
-                }
-                convert_list.append(file_info)
+                    "size_mb": size_mb
+                })
                 total_source_size += file_size
                 
                 # This file will be deleted after conversion
                 delete_list.append({
-                    "name": file_path.name,
-                    "path": str(file_path),
-                    "format": file_path.suffix.upper(),
-                    "size_mb": file_info["size_mb"]
+                    "name": name,
+                    "path": path_str,
+                    "format": file_format,
+                    "size_mb": size_mb
                 })
             except (OSError, PermissionError) as e:
-                logger.warning(f"  ⚠️  Skipping file (cannot access): {file_path} - {e}")
+                logger.warning("  ⚠️  Skipping file (cannot access): %s - %s", file_path, e)
                 continue
         
         # Add macOS resource fork files to delete list (these should not be converted)
@@ -375,7 +916,7 @@ class VideoConverter:
                     "reason": "macOS resource fork file (._*)"
                 })
             except (OSError, PermissionError) as e:
-                logger.warning(f"  ⚠️  Skipping resource fork (cannot access): {fork_path} - {e}")
+                logger.warning("  ⚠️  Skipping resource fork (cannot access): %s - %s", fork_path, e)
                 continue
         
         logger.info(f"  ✓ Found {len(convert_list)} files to convert")
@@ -389,6 +930,7 @@ class VideoConverter:
             "summary": {
                 "total_to_convert": len(convert_list),
                 "total_to_delete": len(delete_list),
+                "already_converted": self.skipped_files,
                 "space_to_free": f"{total_source_size / (1024**3):.2f} GB"
             }
         }
@@ -425,13 +967,14 @@ class VideoConverter:
         """
         # Scan for files
         files_to_convert = []
+        self.skipped_files = 0
         
         if self.movies_dir.exists():
-            movie_files = self._scan_directory(self.movies_dir)
+            movie_files = await asyncio.to_thread(self._scan_directory, self.movies_dir)
             files_to_convert.extend(movie_files)
         
         if self.tv_dir.exists():
-            tv_files = self._scan_directory(self.tv_dir, recursive=True)
+            tv_files = await asyncio.to_thread(self._scan_directory, self.tv_dir, True)
             files_to_convert.extend(tv_files)
         
         # Filter out macOS resource fork files
@@ -446,6 +989,7 @@ class VideoConverter:
         yield {
             "type": "start",
             "total_files": total_files,
+            "skipped": self.skipped_files,
             "max_concurrent": self.max_concurrent
         }
         
@@ -458,12 +1002,23 @@ class VideoConverter:
             }
             return
         
-        # Create semaphore to limit concurrent conversions
-        semaphore = asyncio.Semaphore(self.max_concurrent)
+        # Conversions run as tasks and push their events here; this generator
+        # drains the buffer so events reach the client as soon as they happen.
+        # If the client lags, the oldest progress updates are dropped so the
+        # buffer stays bounded; start/converted/deleted/error events never are.
+        pending_events: deque = deque()
+        event_ready = asyncio.Event()
         
-        # Create lock if not exists (lazy initialization in async context)
-        if self._lock is None:
-            self._lock = asyncio.Lock()
+        def emit(event: Optional[Dict[str, Any]]):
+            if event is not None and event["type"] == "progress" and len(pending_events) >= STREAM_EVENT_BUFFER_SIZE:
+                for position, queued in enumerate(pending_events):
+                    if queued is not None and queued["type"] == "progress":
+                        del pending_events[position]
+                        break
+                else:
+                    return
+            pending_events.append(event)
+            event_ready.set()
         
         # Track progress
         converted_count = 0
@@ -472,110 +1027,98 @@ class VideoConverter:
         completed_count = 0
         
         async def convert_with_progress(file_path: Path, index: int):
-            """Convert a single file and yield progress events."""
+            """Convert a single file and emit its progress events."""
             nonlocal converted_count, deleted_count, error_count, completed_count
             
-            async with semaphore:
-                try:
-                    # Converting event
-                    yield {
-                        "type": "converting",
+            try:
+                # Converting event
+                emit({
+                    "type": "converting",
+                    "file": file_path.name,
+                    "current": index,
+                    "total": total_files
+                })
+                
+                output_path = file_path.with_suffix(TARGET_FORMAT)
+                
+                # Skip if already exists
+                if output_path.exists():
+                    logger.info("  [%d/%d] ⚠️  %s: MP4 already exists, skipping", index, total_files, file_path.name)
+                    converted_count += 1
+                    completed_count += 1
+                    emit({
+                        "type": "converted",
+                        "file": file_path.name
+                    })
+                    return
+                
+                def report_progress(percent: int):
+                    emit({
+                        "type": "progress",
                         "file": file_path.name,
-                        "current": index,
-                        "total": total_files
-                    }
-                    
-                    output_path = file_path.with_suffix(TARGET_FORMAT)
-                    
-                    # Skip if already exists
-                    if output_path.exists():
-                        logger.info(f"  [{index}/{total_files}] ⚠️  {file_path.name}: MP4 already exists, skipping")
-                        async with self._lock:
-                            converted_count += 1
-                            completed_count += 1
-                        yield {
-                            "type": "converted",
-                            "file": file_path.name
-                        }
-                        return
-                    
-                    # Run conversion using the optimized _convert_file method
-                    success = await self._convert_file(file_path, index, total_files)
-                    
-                    async with self._lock:
-                        completed_count += 1
-                        if success:
-                            converted_count += 1
-                            # Delete original
-                            try:
-                                file_path.unlink()
-                                deleted_count += 1
-                                yield {
-                                    "type": "deleted",
-                                    "file": file_path.name,
-                                    "reason": "Original file after conversion",
-                                    "count": deleted_count
-                                }
-                            except Exception as e:
-                                logger.warning(f"  [{index}/{total_files}] ⚠️  Could not delete original: {e}")
-                            
-                            yield {
-                                "type": "converted",
-                                "file": file_path.name
-                            }
-                        else:
-                            error_count += 1
-                            yield {
-                                "type": "error",
-                                "file": file_path.name,
-                                "error": "Conversion failed"
-                            }
-                    
-                except Exception as e:
-                    async with self._lock:
-                        error_count += 1
-                        completed_count += 1
-                    yield {
+                        "percent": percent
+                    })
+                
+                # Run conversion using the optimized _convert_file method
+                # (it deletes the original once the MP4 is verified)
+                success = await self._convert_file(
+                    file_path, index, total_files, on_progress=report_progress
+                )
+                
+                completed_count += 1
+                if success:
+                    converted_count += 1
+                    deleted_count += 1
+                    emit({
+                        "type": "deleted",
+                        "file": file_path.name,
+                        "reason": "Original file after conversion",
+                        "count": deleted_count
+                    })
+                    emit({
+                        "type": "converted",
+                        "file": file_path.name
+                    })
+                else:
+                    error_count += 1
+                    emit({
                         "type": "error",
                         "file": file_path.name,
-                        "error": str(e)
-                    }
-        
-        # Create conversion tasks for all files
-        tasks = []
-        for idx, file_path in enumerate(files_to_convert, 1):
-            task = convert_with_progress(file_path, idx)
-            tasks.append(task)
-        
-        # Process all conversions concurrently, yielding events as they occur
-        # Use asyncio.as_completed to yield events as soon as they're ready
-        conversion_generators = [task for task in tasks]
-        
-        # Run all conversions and collect their events
-        for coro in asyncio.as_completed([gen.__anext__() for gen in conversion_generators]):
-            try:
-                event = await coro
-                yield event
-                # Continue getting events from the same generator
-                # This is a simplified approach - in practice, we need to track each generator
-            except StopAsyncIteration:
-                continue
-        
-        # Better approach: use gather with proper event streaming
+                        "error": "Conversion failed"
+                    })
+                
+            except Exception as e:
+                error_count += 1
+                completed_count += 1
+                emit({
+                    "type": "error",
+                    "file": file_path.name,
+                    "error": str(e)
+                })
+    
         async def run_all_conversions():
-            """Run all conversions and collect events."""
-            conversion_tasks = []
-            for idx, file_path in enumerate(files_to_convert, 1):
-                conversion_tasks.append(convert_with_progress(file_path, idx))
-            
-            # Process events as they come in
-            for task in conversion_tasks:
-                async for event in task:
-                    yield event
+            """Run all conversions, then signal the end of the event stream."""
+            try:
+                await self._run_workers(files_to_convert, convert_with_progress)
+            finally:
+                emit(None)
         
-        # Use the generator approach
-        async for event in run_all_conversions():
-            yield event
+        runner = asyncio.create_task(run_all_conversions())
+        try:
+            while True:
+                while not pending_events:
+                    event_ready.clear()
+                    await event_ready.wait()
+                event = pending_events.popleft()
+                if event is None:
+                    break
+                yield event
+        finally:
+            # Client went away: stop converting, and wait until the ffmpeg children
+            # have exited and their partial outputs are removed
+            if not runner.done():
+                runner.cancel()
+                await asyncio.wait([runner])
         
         # Complete event
         yield {
@@ -583,4 +1126,4 @@ class VideoConverter:
             "converted": converted_count,
             "deleted": deleted_count,
             "errors": error_count
-        }
\ No newline at end of file
+        }
@@ -5,20 +5,28 @@ Scrapes articles from category pages, RSS feeds, and extracts content, images, a
 Uses Trafilatura for high-accuracy content extraction.
 """
 import asyncio
+import functools
 import hashlib
 import logging
+import random
 import re
+import sqlite3
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Any, Tuple
 from urllib.parse import urljoin, urlparse, urlunparse, parse_qs, urlencode
 from email.utils import parsedate_to_datetime
 
+import aiohttp
 import httpx
 import feedparser
 import trafilatura
+from trafilatura.htmlprocessing import build_html_output
+from trafilatura.utils import normalize_unicode
+from trafilatura.xml import xmltotxt
 from bs4 import BeautifulSoup
-from sqlalchemy import select
+from sqlalchemy import insert, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.base import AsyncSessionLocal
@@ -26,21 +34,217 @@ from database.models import ScraperSource, ScrapedArticle, ArticleTextContent, A
 
 logger = logging.getLogger(__name__)
 
+# C-based lxml parses pages far faster than the pure-Python html.parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Common article link patterns as one selector list, so the page is walked once
+ARTICLE_LINK_SELECTOR = ', '.join([
+    'article a[href]',
+    '.article a[href]',
+    '.post a[href]',
+    '.entry a[href]',
+    'a.article-link[href]',
+    'a[class*="article"][href]',
+    'a[class*="post"][href]',
+    'h2 a[href]',
+    'h3 a[href]',
+])
+
+# Common non-article paths, as one alternation compiled once
+NON_ARTICLE_PATH_RE = re.compile(
+    r'/category/|/tag/|/author/|/page/|/search|/about|/contact|/privacy|/terms'
+    r'|/wp-admin|/wp-content|/feed|/rss|#|\?'
+)
+
+# Characters stripped from article titles when naming downloaded images
+SAFE_FILENAME_RE = re.compile(r'[^\w\s-]')
+
+# Maximum URLs per "url IN (...)" existence query
+URL_LOOKUP_CHUNK_SIZE = 500
+
+# Above this many URLs, PostgreSQL gets one array-bound unnest join instead of
+# chunked IN lists, so the planner can hash-join against the url index
+URL_LOOKUP_JOIN_THRESHOLD = 1000
+
+# Existence check for large URL sets: a single text[] parameter, however many URLs
+EXISTING_URLS_JOIN_SQL = text(
+    "SELECT s.url FROM scraped_articles s "
+    "JOIN unnest(CAST(:urls AS text[])) AS c(url) ON s.url = c.url"
+)
+
+# Fast-path extractions shorter than this are retried with Trafilatura's fallbacks
+MIN_FAST_EXTRACTION_CHARS = 500
+
+# On-disk cache of Trafilatura results keyed by page HTML, so retries and pages
+# shared between sources skip re-extraction
+EXTRACTION_CACHE_PATH = Path(__file__).parent.parent / "data" / "cache" / "trafilatura.db"
+EXTRACTION_CACHE_TTL_S = 7 * 24 * 3600
+
+# Article fetch retries for transient failures (exponential backoff with jitter)
+FETCH_MAX_ATTEMPTS = 4
+FETCH_BACKOFF_BASE_S = 1.0
+FETCH_BACKOFF_MAX_S = 30.0
+RETRYABLE_STATUSES = {429, 502, 503, 504}
+
+# Largest article image downloaded; bigger ones are skipped
+MAX_IMAGE_BYTES = 15 * 1024 * 1024
+
+# Article pages fetched at once per scraper; fetches are I/O-bound and independent
+ARTICLE_FETCH_CONCURRENCY = 16
+
+
+def _content_hash(text: str) -> str:
+    """Content id for stored article HTML/text (BLAKE2b is faster than MD5 and not used for security)."""
+    return hashlib.blake2b(text.encode('utf-8', 'ignore'), digest_size=16).hexdigest()
+
+
+def _decode_html(raw_html: bytes, charset: Optional[str]) -> str:
+    """
+    Decode a page body like httpx's .text did: the declared charset (UTF-8 if none or
+    unknown), with undecodable bytes replaced rather than raising.
+    """
+    try:
+        return raw_html.decode(charset or 'utf-8', errors='replace')
+    except LookupError:
+        return raw_html.decode('utf-8', errors='replace')
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds from now."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _image_filename(image_url: str, title: str) -> str:
+    """Build the local filename for an article image (cached; images repeat across articles)."""
+    url_hash = hashlib.md5(image_url.encode()).hexdigest()[:8]
+    safe_title = SAFE_FILENAME_RE.sub('', title)[:50].strip().replace(' ', '_')
+    ext = Path(urlparse(image_url).path).suffix or '.jpg'
+    return f"{safe_title}_{url_hash}{ext}"
+
 
 class WebScraperService:
     """Service for scraping web content from category pages."""
     
-    def __init__(self, images_directory: Optional[str] = None):
+    def __init__(self, images_directory: Optional[str] = None, target_language: Optional[str] = 'en'):
         """
         Initialize the web scraper service.
         
         Args:
             images_directory: Directory to save scraped images
+            target_language: Discard articles not in this language (ISO 639-1);
+                None skips language detection during extraction
         """
         self.images_directory = Path(images_directory) if images_directory else None
+        self.target_language = target_language
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        # Shared HTTP client so page, article and image fetches reuse pooled
+        # keep-alive connections instead of a new TCP/TLS handshake per request
+        self._client: Optional[httpx.AsyncClient] = None
+        # Article pages (the high fan-out path) go through aiohttp, which holds up
+        # better than httpx under many concurrent small GETs
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Per-host "do not send before" times (loop clock) set by 429/503 Retry-After
+        self._host_resume_at: Dict[str, float] = {}
+        self._article_semaphore = asyncio.Semaphore(ARTICLE_FETCH_CONCURRENCY)
+    
+    async def __aenter__(self) -> "WebScraperService":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                headers=self.headers,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=32)
+            )
+        return self._client
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared aiohttp session for article fetches, creating it on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=8, ttl_dns_cache=300)
+            )
+        return self._session
+    
+    async def _fetch_article_html(self, url: str) -> Tuple[str, bytes]:
+        """
+        Fetch an article page, retrying transient failures with exponential backoff.
+        
+        Returns the decoded page along with the raw body bytes, which key the
+        extraction cache without re-encoding the text.
+        
+        Connection errors, timeouts and 429/502/503/504 responses are retried up
+        to FETCH_MAX_ATTEMPTS times. A Retry-After header pauses every request
+        to that host, not just this one; concurrency per host is capped by the
+        session's connector.
+        
+        Raises:
+            aiohttp.ClientError or asyncio.TimeoutError once retries are exhausted
+        """
+        loop = asyncio.get_running_loop()
+        host = urlparse(url).netloc
+        
+        for attempt in range(FETCH_MAX_ATTEMPTS):
+            wait = self._host_resume_at.get(host, 0.0) - loop.time()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            
+            last_attempt = attempt == FETCH_MAX_ATTEMPTS - 1
+            delay = min(FETCH_BACKOFF_MAX_S, FETCH_BACKOFF_BASE_S * (2 ** attempt)) + random.uniform(0, 1)
+            try:
+                async with self._get_session().get(url, allow_redirects=True) as response:
+                    if response.status in RETRYABLE_STATUSES and not last_attempt:
+                        retry_after = _parse_retry_after(response.headers.get('Retry-After'))
+                        if retry_after is not None:
+                            delay = min(FETCH_BACKOFF_MAX_S, retry_after)
+                            self._host_resume_at[host] = max(self._host_resume_at.get(host, 0.0), loop.time() + delay)
+                        reason = f"HTTP {response.status}"
+                    else:
+                        response.raise_for_status()
+                        raw_html = await response.read()
+                        return _decode_html(raw_html, response.charset), raw_html
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if last_attempt:
+                    raise
+                reason = str(e) or type(e).__name__
+            
+            logger.warning(f"  ⚠️  {url}: {reason}, retrying in {delay:.1f}s ({attempt + 1}/{FETCH_MAX_ATTEMPTS})")
+            await asyncio.sleep(delay)
+        
+        raise RuntimeError("unreachable")  # The last attempt always returns or raises
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP clients and their pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
     
     @staticmethod
     def normalize_url(url: str) -> str:
@@ -118,11 +322,30 @@ class WebScraperService:
                 
                 logger.info(f"Found {len(sources)} active sources to scrape")
                 
-                for source in sources:
+                # Discover article URLs for every source up front (network only, no session use)
+                # Limit to 15 newest articles for automatic scraping (only check for new content)
+                discovered = await asyncio.gather(
+                    *(self._discover_article_urls(source, limit=15) for source in sources),
+                    return_exceptions=True
+                )
+                
+                # One existence check for the URLs of all sources instead of one per source
+                all_urls = list(dict.fromkeys(
+                    url
+                    for found in discovered if not isinstance(found, BaseException)
+                    for url in found[0]
+                ))
+                existing_urls = await self._find_existing_urls(session, all_urls)
+                
+                for source, found in zip(sources, discovered):
                     try:
+                        if isinstance(found, BaseException):
+                            raise found
                         logger.info(f"Scraping source: {source.url}")
-                        # Limit to 15 newest articles for automatic scraping (only check for new content)
-                        source_results = await self.scrape_source(source, session, limit=15)
+                        article_urls, feed_data = found
+                        source_results = await self._scrape_new_articles(
+                            source, session, article_urls, feed_data, existing_urls
+                        )
                         
                         results["sources_scraped"] += 1
                         results["articles_found"] += source_results["articles_found"]
@@ -144,6 +367,8 @@ class WebScraperService:
             logger.error(error_msg, exc_info=True)
             results["success"] = False
             results["errors"].append(error_msg)
+        finally:
+            await self.aclose()
         
         return results
     
@@ -164,30 +389,23 @@ class WebScraperService:
         
         try:
             # Fetch the source
-            async with httpx.AsyncClient(timeout=30.0, headers=self.headers, follow_redirects=True) as client:
-                response = await client.get(source.url)
-                response.raise_for_status()
+            response = await self._get_client().get(source.url)
+            response.raise_for_status()
             
             # Check if this is an RSS/Atom feed
-            content_type = response.headers.get('content-type', '').lower()
-            is_feed = (
-                'xml' in content_type or
-                'rss' in content_type or
-                'atom' in content_type or
-                source.url.endswith('.xml') or
-                source.url.endswith('.rss') or
-                '/feed' in source.url.lower() or
-                '/rss' in source.url.lower()
-            )
+            is_feed = self._is_feed_response(response, source.url)
             
             if is_feed:
                 logger.info(f"Detected RSS/Atom feed: {source.url}")
                 article_urls, feed_data = self._extract_urls_and_data_from_feed(response.text)
             else:
                 logger.info(f"Detected HTML page: {source.url}")
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = BeautifulSoup(response.text, HTML_PARSER)
                 article_urls = self._extract_article_urls(soup, source.url)
             
+            # Drop duplicate URLs, keeping feed/page order
+            article_urls = list(dict.fromkeys(article_urls))
+            
             # Apply limit if specified
             original_count = len(article_urls)
             if limit and limit > 0:
@@ -199,10 +417,7 @@ class WebScraperService:
                 return
             
             # Batch check for existing articles (also check normalized versions of existing URLs)
-            existing_urls_result = await session.execute(
-                select(ScrapedArticle.url).where(ScrapedArticle.url.in_(article_urls))
-            )
-            existing_urls = set(row[0] for row in existing_urls_result.fetchall())
+            existing_urls = await self._find_existing_urls(session, article_urls)
             
             # Also normalize existing URLs for comparison (handles old non-normalized entries)
             existing_urls_normalized = {self.normalize_url(url) for url in existing_urls}
@@ -222,6 +437,7 @@ class WebScraperService:
             # Scrape each new article
             saved_count = 0
             failed_count = 0
+            source_id = source.id  # Read once: a rollback below expires the instance
             
             for idx, article_url in enumerate(new_article_urls, 1):
                 try:
@@ -232,50 +448,7 @@ class WebScraperService:
                     article_data = await self.scrape_article(article_url, rss_fallback=rss_fallback)
                     
                     if article_data:
-                        # Create new scraped article
-                        article = ScrapedArticle(
-                            source_id=source.id,
-                            url=article_url,
-                            title=article_data.get('title'),
-                            summary=article_data.get('summary'),
-                            author=article_data.get('author'),
-                            published_date=article_data.get('published_date'),
-                            image_path=article_data.get('image_path'),
-                            image_url=article_data.get('image_url'),
-                            article_metadata=article_data.get('metadata')
-                        )
-                        
-                        session.add(article)
-                        await session.flush()
-                        
-                        article_id = article.id
-                        
-                        # Create separate content records if content exists
-                        content = article_data.get('content')
-                        if content:
-                            html_content = ArticleHtmlContent(
-                                article_id=article_id,
-                                content=content,
-                                sanitized_content=content,
-                                content_type='text/html',
-                                content_hash=hashlib.md5(content.encode()).hexdigest()
-                            )
-                            session.add(html_content)
-                            
-                            soup = BeautifulSoup(content, 'html.parser')
-                            plain_text = soup.get_text(separator=' ', strip=True)
-                            
-                            if plain_text:
-                                text_content = ArticleTextContent(
-                                    article_id=article_id,
-                                    content=plain_text,
-                                    word_count=len(plain_text.split()),
-                                    character_count=len(plain_text),
-                                    content_hash=hashlib.md5(plain_text.encode()).hexdigest()
-                                )
-                                session.add(text_content)
-                        
-                        await session.commit()
+                        await self._save_articles(session, source_id, [(article_url, article_data)])
                         saved_count += 1
                         yield {"type": "scraped", "url": article_url, "used_rss_fallback": article_data.get('metadata', {}).get('used_rss_fallback', False)}
                     else:
@@ -306,166 +479,286 @@ class WebScraperService:
         Returns:
             Dictionary with results
         """
-        results = {
-            "articles_found": 0,
-            "articles_saved": 0
-        }
+        try:
+            article_urls, feed_data = await self._discover_article_urls(source, limit)
+            # Batch check for existing articles to reduce database queries
+            existing_urls = await self._find_existing_urls(session, article_urls)
+            return await self._scrape_new_articles(source, session, article_urls, feed_data, existing_urls)
+        except Exception as e:
+            logger.error(f"Error scraping source {source.url}: {e}", exc_info=True)
+            raise
+    
+    async def _discover_article_urls(
+        self,
+        source: ScraperSource,
+        limit: Optional[int] = None
+    ) -> Tuple[List[str], Dict[str, Dict]]:
+        """
+        Fetch a source page or feed and list the article URLs it links to.
         
+        Args:
+            source: ScraperSource model instance
+            limit: Optional limit on number of article URLs (newest first)
+            
+        Returns:
+            Tuple of (article URLs, feed entry data keyed by URL for RSS fallback)
+        """
         # Store feed data for fallback content extraction
         feed_data = {}
         
-        try:
-            # Fetch the source
-            async with httpx.AsyncClient(timeout=30.0, headers=self.headers, follow_redirects=True) as client:
-                response = await client.get(source.url)
-                response.raise_for_status()
-            
-            # Check if this is an RSS/Atom feed
-            content_type = response.headers.get('content-type', '').lower()
-            is_feed = (
-                'xml' in content_type or
-                'rss' in content_type or
-                'atom' in content_type or
-                source.url.endswith('.xml') or
-                source.url.endswith('.rss') or
-                '/feed' in source.url.lower() or
-                '/rss' in source.url.lower()
-            )
+        # Fetch the source
+        response = await self._get_client().get(source.url)
+        response.raise_for_status()
+        
+        # Check if this is an RSS/Atom feed
+        content_type = response.headers.get('content-type', '').lower()
+        is_feed = self._is_feed_response(response, source.url)
+        
+        if is_feed:
+            logger.info(f"Detected RSS/Atom feed: {source.url}")
+            article_urls, feed_data = self._extract_urls_and_data_from_feed(response.text)
+            if not article_urls:
+                logger.warning(f"⚠️  No URLs extracted from RSS feed: {source.url}")
+                logger.warning(f"   Feed content length: {len(response.text)}")
+                logger.warning(f"   Content type: {content_type}")
+                # Try to debug feed parsing
+                try:
+                    feed = feedparser.parse(response.text)
+                    logger.warning(f"   Feed entries found: {len(feed.entries)}")
+                    if feed.bozo:
+                        logger.warning(f"   Feed parsing error: {feed.bozo_exception}")
+                except Exception as e:
+                    logger.warning(f"   Feed parsing exception: {e}")
+        else:
+            logger.info(f"Detected HTML page: {source.url}")
+            soup = BeautifulSoup(response.text, HTML_PARSER)
+            article_urls = self._extract_article_urls(soup, source.url)
+            if not article_urls:
+                logger.warning(f"⚠️  No URLs extracted from HTML page: {source.url}")
+                logger.warning(f"   Page content length: {len(response.text)}")
+                logger.warning(f"   Tried {len(soup.select('a[href]'))} total links on page")
+        
+        # Drop duplicate URLs, keeping feed/page order
+        article_urls = list(dict.fromkeys(article_urls))
+        
+        # Apply limit if specified (for automatic scraping - only check newest articles)
+        original_count = len(article_urls)
+        if limit and limit > 0:
+            article_urls = article_urls[:limit]
+            logger.info(f"Limited to {limit} newest articles (from {original_count} total)")
+        
+        logger.info(f"Found {len(article_urls)} article URLs on {source.url}")
+        return article_urls, feed_data
+    
+    async def _scrape_new_articles(
+        self,
+        source: ScraperSource,
+        session: AsyncSession,
+        article_urls: List[str],
+        feed_data: Dict[str, Dict],
+        existing_urls: set
+    ) -> Dict[str, int]:
+        """
+        Scrape and save the discovered articles that are not stored yet.
+        
+        Args:
+            source: ScraperSource model instance
+            session: Database session
+            article_urls: URLs returned by _discover_article_urls
+            feed_data: Feed entry data returned by _discover_article_urls
+            existing_urls: URLs already stored (saved URLs are added to it)
             
-            if is_feed:
-                logger.info(f"Detected RSS/Atom feed: {source.url}")
-                article_urls, feed_data = self._extract_urls_and_data_from_feed(response.text)
-                if not article_urls:
-                    logger.warning(f"⚠️  No URLs extracted from RSS feed: {source.url}")
-                    logger.warning(f"   Feed content length: {len(response.text)}")
-                    logger.warning(f"   Content type: {content_type}")
-                    # Try to debug feed parsing
+        Returns:
+            Dictionary with results
+        """
+        results = {
+            "articles_found": len(article_urls),
+            "articles_saved": 0
+        }
+        
+        if len(article_urls) == 0:
+            logger.error(f"❌ Source {source.name} ({source.url}) returned 0 article URLs - check feed/page structure")
+            return results
+        
+        # Also normalize existing URLs for comparison (handles old non-normalized entries)
+        existing_urls_normalized = {self.normalize_url(url) for url in existing_urls}
+        
+        # Filter out existing articles (check both exact and normalized matches)
+        new_article_urls = [
+            url for url in article_urls 
+            if url not in existing_urls and self.normalize_url(url) not in existing_urls_normalized
+        ]
+        skipped_count = len(article_urls) - len(new_article_urls)
+        
+        if skipped_count > 0:
+            logger.info(f"⏭️  Skipping {skipped_count} already scraped articles")
+        
+        if not new_article_urls:
+            logger.info(f"✓ All articles from {source.url} already scraped")
+            return results
+        
+        logger.info(f"📥 Scraping {len(new_article_urls)} new articles from {source.url}")
+        
+        async def fetch_article(idx: int, article_url: str) -> Optional[Dict[str, Any]]:
+            async with self._article_semaphore:
+                logger.info(f"  [{idx}/{len(new_article_urls)}] Scraping: {article_url}")
+                # Scrape the article, passing feed data as fallback
+                return await self.scrape_article(article_url, rss_fallback=feed_data.get(article_url))
+        
+        # Fetch concurrently, then save one by one: the session is not safe for concurrent use
+        scraped = await asyncio.gather(
+            *(fetch_article(idx, article_url) for idx, article_url in enumerate(new_article_urls, 1)),
+            return_exceptions=True
+        )
+        
+        scraped_articles = []
+        for article_url, article_data in zip(new_article_urls, scraped):
+            if isinstance(article_data, Exception):
+                logger.error(f"  ❌ Error scraping {article_url}: {article_data}")
+            elif article_data:
+                scraped_articles.append((article_url, article_data))
+            else:
+                logger.warning(f"  ⚠️  Failed to extract content: {article_url}")
+        
+        if scraped_articles:
+            source_id = source.id  # Read once: a rollback below expires the instance
+            try:
+                # One flush and one commit for the whole batch
+                await self._save_articles(session, source_id, scraped_articles)
+                saved_articles = scraped_articles
+            except Exception as e:
+                logger.warning(f"  ⚠️  Batch save failed ({e}), saving articles one by one")
+                await session.rollback()
+                saved_articles = []
+                for article_url, article_data in scraped_articles:
                     try:
-                        feed = feedparser.parse(response.text)
-                        logger.warning(f"   Feed entries found: {len(feed.entries)}")
-                        if feed.bozo:
-                            logger.warning(f"   Feed parsing error: {feed.bozo_exception}")
+                        await self._save_articles(session, source_id, [(article_url, article_data)])
+                        saved_articles.append((article_url, article_data))
                     except Exception as e:
-                        logger.warning(f"   Feed parsing exception: {e}")
-            else:
-                logger.info(f"Detected HTML page: {source.url}")
-                soup = BeautifulSoup(response.text, 'html.parser')
-                article_urls = self._extract_article_urls(soup, source.url)
-                if not article_urls:
-                    logger.warning(f"⚠️  No URLs extracted from HTML page: {source.url}")
-                    logger.warning(f"   Page content length: {len(response.text)}")
-                    logger.warning(f"   Tried {len(soup.select('a[href]'))} total links on page")
-            
-            # Apply limit if specified (for automatic scraping - only check newest articles)
-            original_count = len(article_urls)
-            if limit and limit > 0:
-                article_urls = article_urls[:limit]
-                logger.info(f"Limited to {limit} newest articles (from {original_count} total)")
+                        logger.error(f"  ❌ Error saving {article_url}: {e}")
+                        await session.rollback()
             
-            results["articles_found"] = len(article_urls)
-            logger.info(f"Found {len(article_urls)} article URLs on {source.url}")
-            
-            if len(article_urls) == 0:
-                logger.error(f"❌ Source {source.name} ({source.url}) returned 0 article URLs - check feed/page structure")
-                return results
-            
-            # Batch check for existing articles to reduce database queries
-            existing_urls_result = await session.execute(
-                select(ScrapedArticle.url).where(ScrapedArticle.url.in_(article_urls))
-            )
-            existing_urls = set(row[0] for row in existing_urls_result.fetchall())
-            
-            # Also normalize existing URLs for comparison (handles old non-normalized entries)
-            existing_urls_normalized = {self.normalize_url(url) for url in existing_urls}
-            
-            # Filter out existing articles (check both exact and normalized matches)
-            new_article_urls = [
-                url for url in article_urls 
-                if url not in existing_urls and self.normalize_url(url) not in existing_urls_normalized
-            ]
-            skipped_count = len(article_urls) - len(new_article_urls)
-            
-            if skipped_count > 0:
-                logger.info(f"⏭️  Skipping {skipped_count} already scraped articles")
-            
-            if not new_article_urls:
-                logger.info(f"✓ All articles from {source.url} already scraped")
-                return results
-            
-            logger.info(f"📥 Scraping {len(new_article_urls)} new articles from {source.url}")
-            
-            # Scrape each new article
-            for idx, article_url in enumerate(new_article_urls, 1):
-                try:
-                    logger.info(f"  [{idx}/{len(new_article_urls)}] Scraping: {article_url}")
-                    
-                    # Scrape the article, passing feed data as fallback
-                    rss_fallback = feed_data.get(article_url)
-                    article_data = await self.scrape_article(article_url, rss_fallback=rss_fallback)
-                    
-                    if article_data:
-                        # Create new scraped article (without content field)
-                        article = ScrapedArticle(
-                            source_id=source.id,
-                            url=article_url,
-                            title=article_data.get('title'),
-                            summary=article_data.get('summary'),
-                            author=article_data.get('author'),
-                            published_date=article_data.get('published_date'),
-                            image_path=article_data.get('image_path'),
-                            image_url=article_data.get('image_url'),
-                            article_metadata=article_data.get('metadata')
-                        )
-                        
-                        session.add(article)
-                        await session.flush()  # Get article.id before creating content
-                        
-                        # Get the article ID after flush to avoid repeated access
-                        article_id = article.id
-                        
-                        # Create separate content records if content exists
-                        content = article_data.get('content')
-                        if content:
-                            # Create HTML content record
-                            html_content = ArticleHtmlContent(
-                                article_id=article_id,
-                                content=content,
-                                sanitized_content=content,  # Could add sanitization here
-                                content_type='text/html',
-                                content_hash=hashlib.md5(content.encode()).hexdigest()
-                            )
-                            session.add(html_content)
-                            
-                            # Extract plain text from HTML for text content
-                            soup = BeautifulSoup(content, 'html.parser')
-                            plain_text = soup.get_text(separator=' ', strip=True)
-                            
-                            if plain_text:
-                                text_content = ArticleTextContent(
-                                    article_id=article_id,
-                                    content=plain_text,
-                                    word_count=len(plain_text.split()),
-                                    character_count=len(plain_text),
-                                    content_hash=hashlib.md5(plain_text.encode()).hexdigest()
-                                )
-                                session.add(text_content)
-                        
-                        await session.commit()
-                        results["articles_saved"] += 1
-                        logger.info(f"  ✓ Saved: {article_data.get('title', article_url)[:80]}")
-                    else:
-                        logger.warning(f"  ⚠️  Failed to extract content: {article_url}")
-                    
-                except Exception as e:
-                    logger.error(f"  ❌ Error scraping {article_url}: {e}")
-                    await session.rollback()
-            
-        except Exception as e:
-            logger.error(f"Error scraping source {source.url}: {e}", exc_info=True)
-            raise
+            results["articles_saved"] += len(saved_articles)
+            for article_url, article_data in saved_articles:
+                existing_urls.add(article_url)
+                logger.info(f"  ✓ Saved: {(article_data.get('title') or article_url)[:80]}")
         
         return results
     
+    @staticmethod
+    async def _find_existing_urls(session: AsyncSession, urls: List[str]) -> set:
+        """
+        Return which of the given URLs are already stored as scraped articles.
+        
+        Queries in chunks of URL_LOOKUP_CHUNK_SIZE so the IN list stays small
+        enough for the planner (the url column is uniquely indexed). Very large
+        sets on PostgreSQL are joined against an unnest()ed array in one query.
+        """
+        if len(urls) > URL_LOOKUP_JOIN_THRESHOLD and session.get_bind().dialect.name == 'postgresql':
+            result = await session.execute(EXISTING_URLS_JOIN_SQL, {"urls": list(urls)})
+            return set(result.scalars())
+        
+        existing = set()
+        for start in range(0, len(urls), URL_LOOKUP_CHUNK_SIZE):
+            chunk = urls[start:start + URL_LOOKUP_CHUNK_SIZE]
+            result = await session.execute(
+                select(ScrapedArticle.url).where(ScrapedArticle.url.in_(chunk))
+            )
+            existing.update(result.scalars())
+        return existing
+    
+    async def _save_articles(
+        self,
+        session: AsyncSession,
+        source_id: int,
+        scraped_articles: List[Tuple[str, Dict[str, Any]]]
+    ) -> None:
+        """
+        Save scraped articles and their content records in a single transaction.
+        
+        Args:
+            session: Database session
+            source_id: ID of the source the articles came from
+            scraped_articles: (article URL, article data from scrape_article) pairs
+        """
+        articles = [
+            ScrapedArticle(
+                source_id=source_id,
+                url=article_url,
+                title=article_data.get('title'),
+                summary=article_data.get('summary'),
+                author=article_data.get('author'),
+                published_date=article_data.get('published_date'),
+                image_path=article_data.get('image_path'),
+                image_url=article_data.get('image_url'),
+                article_metadata=article_data.get('metadata')
+            )
+            for article_url, article_data in scraped_articles
+        ]
+        session.add_all(articles)
+        await session.flush()  # Assigns article ids for the content records
+        
+        # Content records go in as Core executemany inserts: no per-row ORM bookkeeping
+        html_rows = []
+        text_rows = []
+        for article, (_, article_data) in zip(articles, scraped_articles):
+            # Create separate content records if content exists
+            content = article_data.get('content')
+            if not content:
+                continue
+            html_rows.append({
+                "article_id": article.id,
+                "content": content,
+                "sanitized_content": content,  # Could add sanitization here
+                "content_type": 'text/html',
+                "content_hash": _content_hash(content)
+            })
+            
+            # Plain text comes from the same extraction as the HTML
+            plain_text = article_data.get('plain_text')
+            if plain_text:
+                text_rows.append({
+                    "article_id": article.id,
+                    "content": plain_text,
+                    "word_count": len(plain_text.split()),
+                    "character_count": len(plain_text),
+                    "content_hash": _content_hash(plain_text)
+                })
+        
+        if html_rows:
+            await session.execute(insert(ArticleHtmlContent), html_rows)
+        if text_rows:
+            await session.execute(insert(ArticleTextContent), text_rows)
+        
+        await session.commit()
+    
+    @staticmethod
+    def _is_feed_response(response: httpx.Response, url: str) -> bool:
+        """
+        Decide whether a fetched source is an RSS/Atom feed or an HTML page.
+        
+        Sniffs the first bytes of the body before falling back to the
+        content type and URL, so feeds served as text/html (and HTML pages
+        under /feed-like URLs) are routed to the right parser.
+        """
+        head = response.content[:512].lstrip().lower()
+        if b'<rss' in head or b'<feed' in head or b'<rdf:rdf' in head:
+            return True
+        if b'<html' in head or b'<!doctype html' in head:
+            return False
+        
+        content_type = response.headers.get('content-type', '').lower()
+        url = url.lower()
+        return (
+            'xml' in content_type or
+            'rss' in content_type or
+            'atom' in content_type or
+            url.endswith('.xml') or
+            url.endswith('.rss') or
+            '/feed' in url or
+            '/rss' in url
+        )
+    
     def _extract_urls_from_feed(self, feed_content: str) -> List[str]:
         """
         Extract article URLs from an RSS/Atom feed.
@@ -490,7 +783,10 @@ class WebScraperService:
             Tuple of (list of article URLs, dict mapping URL to feed entry data)
         """
         try:
-            feed = feedparser.parse(feed_content)
+            # Relative URIs inside entry HTML are not resolved here: only entry links are
+            # needed up front, and RSS content images are made absolute by _fix_image_urls.
+            # HTML sanitizing stays on since entry content can be saved and displayed.
+            feed = feedparser.parse(feed_content, resolve_relative_uris=False)
             article_urls = []
             feed_data = {}
             
@@ -574,84 +870,43 @@ class WebScraperService:
         Returns:
             List of article URLs
         """
-        article_urls = []
-        
-        # Common patterns for article links
-        # This is a generic approach - might need customization per site
-        
-        # Look for common article link patterns
-        selectors = [
-            'article a[href]',
-            '.article a[href]',
-            '.post a[href]',
-            '.entry a[href]',
-            'a.article-link[href]',
-            'a[class*="article"][href]',
-            'a[class*="post"][href]',
-            'h2 a[href]',
-            'h3 a[href]',
-        ]
-        
         found_links = set()
+        base_netloc = urlparse(base_url).netloc
         
-        for selector in selectors:
-            links = soup.select(selector)
-            for link in links:
-                href = link.get('href')
-                if href:
-                    # Convert relative URLs to absolute
-                    full_url = urljoin(base_url, href)
-                    
-                    # Filter out non-article URLs and normalize
-                    if self._is_likely_article_url(full_url, base_url):
-                        normalized_url = self.normalize_url(full_url)
-                        found_links.add(normalized_url)
+        # Common patterns for article links, matched in one pass over the DOM
+        # This is a generic approach - might need customization per site
+        for link in soup.select(ARTICLE_LINK_SELECTOR):
+            href = link.get('href')
+            if href:
+                # Convert relative URLs to absolute
+                full_url = urljoin(base_url, href)
+                
+                # Filter out non-article URLs and normalize
+                if self._is_likely_article_url(full_url, base_netloc):
+                    normalized_url = self.normalize_url(full_url)
+                    found_links.add(normalized_url)
         
         return list(found_links)
     
-    def _is_likely_article_url(self, url: str, base_url: str) -> bool:
+    def _is_likely_article_url(self, url: str, base_netloc: str) -> bool:
         """
         Check if a URL is likely an article (not navigation, category, etc.).
         
         Args:
             url: URL to check
-            base_url: Base URL of the site
+            base_netloc: Network location of the site being scraped
             
         Returns:
             True if likely an article URL
         """
         parsed = urlparse(url)
-        parsed_base = urlparse(base_url)
         
         # Must be same domain
-        if parsed.netloc != parsed_base.netloc:
+        if parsed.netloc != base_netloc:
             return False
         
         # Exclude common non-article paths
-        exclude_patterns = [
-            r'/category/',
-            r'/tag/',
-            r'/author/',
-            r'/page/',
-            r'/search',
-            r'/about',
-            r'/contact',
-            r'/privacy',
-            r'/terms',
-            r'/wp-admin',
-            r'/wp-content',
-            r'/feed',
-            r'/rss',
-            r'#',
-            r'\?',
-        ]
-        
-        path = parsed.path.lower()
-        for pattern in exclude_patterns:
-            if re.search(pattern, path):
-                return False
-        
-        return True
+        return not NON_ARTICLE_PATH_RE.search(parsed.path.lower())
     
     async def scrape_article(self, url: str, rss_fallback: Optional[Dict] = None) -> Optional[Dict[str, Any]]:
         """
@@ -665,36 +920,32 @@ class WebScraperService:
         Returns:
             Dictionary with article data or None if failed
         """
+        image_task = None
         try:
             # Fetch the article page
-            async with httpx.AsyncClient(timeout=30.0, headers=self.headers, follow_redirects=True) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-            
-            html_content = response.text
+            html_content, raw_html = await self._fetch_article_html(url)
             
             # Use Trafilatura to extract content and metadata with error handling
             metadata = None
             content = None
+            plain_text = None
             
             try:
-                # Extract metadata first
-                metadata = trafilatura.extract_metadata(html_content)
+                # Extract metadata first. Trafilatura is CPU-bound, so it runs in a worker
+                # thread and other articles' fetches keep progressing meanwhile.
+                metadata = await asyncio.to_thread(trafilatura.extract_metadata, html_content)
             except Exception as e:
                 logger.warning(f"Failed to extract metadata from {url}: {e}")
             
-            try:
-                # Extract main content as HTML to preserve formatting
-                content = trafilatura.extract(
-                    html_content,
-                    include_comments=False,
-                    include_tables=True,
-                    include_images=True,
-                    include_formatting=True,
-                    no_fallback=False,
-                    output_format='html',
-                    target_language='en'
+            # Start downloading the main image now so it overlaps with content extraction
+            if metadata and metadata.image and self.images_directory:
+                image_task = asyncio.create_task(
+                    self._download_image(metadata.image, metadata.title or url)
                 )
+            
+            try:
+                # Extract main content as HTML to preserve formatting, plus its plain text
+                content, plain_text = await asyncio.to_thread(self._extract_content, html_content, raw_html)
                 
                 # Post-process content to ensure images are in correct positions with absolute URLs
                 if content:
@@ -704,20 +955,22 @@ class WebScraperService:
                 logger.warning(f"Trafilatura HTML extraction failed for {url}: {e}")
                 # Fallback to simple text extraction
                 try:
-                    content = trafilatura.extract(
+                    content = await asyncio.to_thread(
+                        trafilatura.extract,
                         html_content,
                         include_formatting=False,
                         no_fallback=False,
                         output_format='txt'
                     )
                     if content:
+                        plain_text = content
                         # Wrap plain text in basic HTML
                         content = f"<p>{content.replace(chr(10), '</p><p>')}</p>"
                 except Exception as e2:
                     logger.warning(f"Trafilatura text extraction also failed for {url}: {e2}")
                     # Final fallback: use BeautifulSoup to extract main content
                     try:
-                        soup = BeautifulSoup(html_content, 'html.parser')
+                        soup = BeautifulSoup(html_content, HTML_PARSER)
                         # Try to find main article content
                         main_content = None
                         
@@ -754,6 +1007,7 @@ class WebScraperService:
                                 # Split into paragraphs and wrap
                                 paragraphs = [p.strip() for p in text.split('\n') if p.strip()]
                                 content = ''.join([f'<p>{p}</p>' for p in paragraphs])
+                                plain_text = ' '.join(paragraphs)
                                 logger.info(f"Used BeautifulSoup fallback for {url}, extracted {len(content)} chars")
                             else:
                                 content = None
@@ -767,7 +1021,7 @@ class WebScraperService:
             # If metadata extraction failed, try BeautifulSoup for title/author
             if not metadata:
                 try:
-                    soup = BeautifulSoup(html_content, 'html.parser')
+                    soup = BeautifulSoup(html_content, HTML_PARSER)
                     # Try to get title from various sources
                     title = None
                     for selector in ['h1', 'title', 'meta[property="og:title"]', 'meta[name="twitter:title"]']:
@@ -811,6 +1065,7 @@ class WebScraperService:
             article_data = {
                 'title': metadata.title if metadata else None,
                 'content': content,
+                'plain_text': plain_text,
                 'summary': metadata.description if metadata else None,
                 'author': metadata.author if metadata else None,
                 'published_date': None,
@@ -829,14 +1084,17 @@ class WebScraperService:
             if not article_data['image_url']:
                 try:
                     if 'soup' not in locals():
-                        soup = BeautifulSoup(html_content, 'html.parser')
+                        soup = BeautifulSoup(html_content, HTML_PARSER)
                     article_data['image_url'] = self._extract_main_image(soup, url)
                 except Exception as e:
                     logger.warning(f"Failed to extract image from {url}: {e}")
                     article_data['image_url'] = None
             
-            # Download and save the main image
-            if article_data['image_url'] and self.images_directory:
+            # Download and save the main image (already in flight if it came from the metadata)
+            if image_task is not None:
+                article_data['image_path'] = await image_task
+                image_task = None
+            elif article_data['image_url'] and self.images_directory:
                 image_path = await self._download_image(
                     article_data['image_url'],
                     article_data['title'] or url
@@ -859,6 +1117,7 @@ class WebScraperService:
                     # Fix image URLs in RSS content too
                     rss_content = self._fix_image_urls(rss_content, url)
                     article_data['content'] = rss_content
+                    article_data['plain_text'] = BeautifulSoup(rss_content, HTML_PARSER).get_text(separator=' ', strip=True)
                     content = rss_content  # Update content variable for validation
                     logger.info(f"   ✓ Using RSS content ({len(rss_content)} chars)")
                 
@@ -871,7 +1130,7 @@ class WebScraperService:
                     summary = rss_fallback['summary']
                     if '<' in summary:
                         try:
-                            summary = BeautifulSoup(summary, 'html.parser').get_text(strip=True)
+                            summary = BeautifulSoup(summary, HTML_PARSER).get_text(strip=True)
                         except:
                             pass
                     article_data['summary'] = summary[:500]  # Limit summary length
@@ -920,7 +1179,109 @@ class WebScraperService:
             
         except Exception as e:
             logger.error(f"Error scraping article {url}: {e}", exc_info=True)
+            if image_task is not None:
+                image_task.cancel()
+            return None
+    
+    def _extract_content(self, html_content: str, raw_html: Optional[bytes] = None) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Extract (HTML content, plain text) from a page, reusing earlier results for identical HTML.
+        
+        Trafilatura's own extractor handles most pages; its slower readability/justext
+        comparison only runs when that finds little or nothing. Runs in a worker thread.
+        The cache is keyed by the raw response bytes when given, else the encoded HTML.
+        """
+        if raw_html is None:
+            raw_html = html_content.encode('utf-8', 'ignore')
+        cache_key = f"{self.target_language}:{hashlib.blake2b(raw_html, digest_size=16).hexdigest()}"
+        cached = self._read_extraction_cache(cache_key)
+        if cached is not None:
+            return cached
+        
+        content, plain_text = self._extract_html_and_text(html_content, no_fallback=True)
+        if not content or len(content) < MIN_FAST_EXTRACTION_CHARS:
+            retry_content, retry_plain_text = self._extract_html_and_text(html_content, no_fallback=False)
+            if retry_content and len(retry_content) > len(content or ''):
+                content, plain_text = retry_content, retry_plain_text
+        
+        self._write_extraction_cache(cache_key, content, plain_text)
+        return content, plain_text
+    
+    @staticmethod
+    def _connect_extraction_cache() -> sqlite3.Connection:
+        """Open the Trafilatura extraction cache, creating it if needed."""
+        EXTRACTION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(EXTRACTION_CACHE_PATH, timeout=5)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS extractions ("
+            "key TEXT PRIMARY KEY, content TEXT, plain_text TEXT, created_at REAL)"
+        )
+        return conn
+    
+    def _read_extraction_cache(self, key: str) -> Optional[Tuple[Optional[str], Optional[str]]]:
+        """Return a cached (content, plain text) pair if it is younger than EXTRACTION_CACHE_TTL_S."""
+        try:
+            conn = self._connect_extraction_cache()
+            try:
+                row = conn.execute(
+                    "SELECT content, plain_text FROM extractions WHERE key = ? AND created_at > ?",
+                    (key, time.time() - EXTRACTION_CACHE_TTL_S)
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Extraction cache read failed: {e}")
             return None
+        
+        return (row[0], row[1]) if row is not None else None
+    
+    def _write_extraction_cache(self, key: str, content: Optional[str], plain_text: Optional[str]) -> None:
+        """Store an extraction result, dropping entries past their TTL."""
+        now = time.time()
+        try:
+            conn = self._connect_extraction_cache()
+            try:
+                with conn:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO extractions (key, content, plain_text, created_at) VALUES (?, ?, ?, ?)",
+                        (key, content, plain_text, now)
+                    )
+                    conn.execute("DELETE FROM extractions WHERE created_at <= ?", (now - EXTRACTION_CACHE_TTL_S,))
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.debug(f"Extraction cache write failed: {e}")
+    
+    def _extract_html_and_text(self, html_content: str, no_fallback: bool) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Run Trafilatura once and render the extracted body as both HTML and plain text.
+        
+        Equivalent to trafilatura.extract() with output_format='html' and 'txt',
+        without parsing and extracting the page twice.
+        
+        Args:
+            html_content: Raw page HTML
+            no_fallback: Skip Trafilatura's fallback extractors (faster)
+            
+        Returns:
+            Tuple of (HTML content, plain text), both None if nothing was extracted
+        """
+        document = trafilatura.bare_extraction(
+            html_content,
+            include_comments=False,
+            include_tables=True,
+            include_images=True,
+            include_formatting=True,
+            no_fallback=no_fallback,
+            output_format='html',
+            target_language=self.target_language,
+            as_dict=False
+        )
+        if document is None:
+            return None, None
+        # Render text first: the HTML conversion rewrites the body tree in place
+        plain_text = normalize_unicode(xmltotxt(document.body, False))
+        return normalize_unicode(build_html_output(document)), plain_text
     
     def _fix_image_urls(self, html_content: str, base_url: str) -> str:
         """
@@ -937,6 +1298,7 @@ class WebScraperService:
             return html_content
             
         try:
+            # html.parser keeps the fragment as-is; lxml would wrap it in <html><body>
             soup = BeautifulSoup(html_content, 'html.parser')
             
             # Find all images and convert relative URLs to absolute
@@ -1004,10 +1366,7 @@ class WebScraperService:
             self.images_directory.mkdir(parents=True, exist_ok=True)
             
             # Generate filename
-            url_hash = hashlib.md5(image_url.encode()).hexdigest()[:8]
-            safe_title = re.sub(r'[^\w\s-]', '', title)[:50].strip().replace(' ', '_')
-            ext = Path(urlparse(image_url).path).suffix or '.jpg'
-            filename = f"{safe_title}_{url_hash}{ext}"
+            filename = _image_filename(image_url, title)
             filepath = self.images_directory / filename
             
             # Check if already downloaded
@@ -1015,16 +1374,33 @@ class WebScraperService:
                 logger.debug(f"Image already exists: {filename}")
                 return str(filepath)
             
-            # Download the image
-            async with httpx.AsyncClient(timeout=30.0, headers=self.headers) as client:
-                response = await client.get(image_url)
-                response.raise_for_status()
-                
-                # Save the image
-                filepath.write_bytes(response.content)
-                logger.info(f"Downloaded image: {filename}")
-                
-                return str(filepath)
+            # Stream the image to a temporary file so large images are never held in
+            # memory whole, and an aborted download never looks like a saved image
+            partial_path = filepath.with_name(filepath.name + '.part')
+            size = 0
+            try:
+                async with self._get_client().stream('GET', image_url) as response:
+                    response.raise_for_status()
+                    with partial_path.open('wb') as f:
+                        async for chunk in response.aiter_bytes(65536):
+                            size += len(chunk)
+                            if size > MAX_IMAGE_BYTES:
+                                break
+                            f.write(chunk)
+            except Exception:
+                partial_path.unlink(missing_ok=True)
+                raise
+            
+            if size > MAX_IMAGE_BYTES:
+                partial_path.unlink(missing_ok=True)
+                logger.warning(f"Skipping image larger than {MAX_IMAGE_BYTES // (1024 * 1024)}MB: {image_url}")
+                return None
+            
+            # Save the image
+            partial_path.replace(filepath)
+            logger.info(f"Downloaded image: {filename}")
+            
+            return str(filepath)
                 
         except Exception as e:
             logger.warning(f"Failed to download image from {image_url}: {e}")
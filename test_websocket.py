@@ -1,10 +1,19 @@
 #!/usr/bin/env python3
 """Test script for WebSocket connection to Dragonfly."""
 import asyncio
-import json
 import websockets
 import sys
 
+try:
+    import orjson
+    
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()  # Keep text frames, as the server expects
+    
+    json_loads = orjson.loads
+except ImportError:
+    from json import dumps as json_dumps, loads as json_loads
+
 
 async def test_websocket():
     """Test connecting to the WebSocket server."""
@@ -15,8 +24,8 @@ async def test_websocket():
         async with websockets.connect(uri) as websocket:
             print("✓ Connected successfully!\n")
             
-            # Test 1: Register a device
-            print("Test 1: Registering a test device...")
+            # Tests 1, 2 and 4 don't depend on each other's responses, so send them all
+            # up front and then read the replies (the server answers in order per connection)
             register_message = {
                 "type": "device_register",
                 "device_id": "test-device-001",
@@ -27,12 +36,6 @@ async def test_websocket():
                     "version": "1.0"
                 }
             }
-            await websocket.send(json.dumps(register_message))
-            response = await websocket.recv()
-            print(f"Response: {json.loads(response)}\n")
-            
-            # Test 2: Submit a job
-            print("Test 2: Submitting a job...")
             job_message = {
                 "type": "job",
                 "service_name": "ai_service",
@@ -40,38 +43,42 @@ async def test_websocket():
                     "question": "What is the weather today?"
                 }
             }
-            await websocket.send(json.dumps(job_message))
-            response = await websocket.recv()
-            job_response = json.loads(response)
-            print(f"Response: {job_response}\n")
+            data_message = {
+                "type": "data",
+                "data": {
+                    "sensor_reading": 23.5,
+                    "unit": "celsius"
+                }
+            }
+            pipelined = [
+                ("Test 1: Registering a test device...", register_message),
+                ("Test 2: Submitting a job...", job_message),
+                ("Test 4: Sending a data message...", data_message),
+            ]
             
+            for _, message in pipelined:
+                await websocket.send(json_dumps(message))
+            
+            responses = [json_loads(await websocket.recv()) for _ in pipelined]
+            for (label, _), response in zip(pipelined, responses):
+                print(label)
+                print(f"Response: {response}\n")
+            
+            job_response = responses[1]
             if job_response.get("type") == "job_submitted":
                 job_id = job_response.get("job_id")
                 
-                # Test 3: Check job status
+                # Test 3: Check job status (needs the job_id from Test 2)
                 print(f"Test 3: Checking job status for {job_id}...")
                 status_message = {
                     "type": "job_status",
                     "job_id": job_id
                 }
-                await websocket.send(json.dumps(status_message))
+                await websocket.send(json_dumps(status_message))
                 response = await websocket.recv()
-                status_response = json.loads(response)
+                status_response = json_loads(response)
                 print(f"Response: {status_response}\n")
             
-            # Test 4: Send a data message
-            print("Test 4: Sending a data message...")
-            data_message = {
-                "type": "data",
-                "data": {
-                    "sensor_reading": 23.5,
-                    "unit": "celsius"
-                }
-            }
-            await websocket.send(json.dumps(data_message))
-            response = await websocket.recv()
-            print(f"Response: {json.loads(response)}\n")
-            
             print("All tests completed!")
             
     except websockets.exceptions.ConnectionRefused:
@@ -0,0 +1,38 @@
+"""Shared helpers for integration tests."""
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+# Modules that are skipped wholesale; ignoring them avoids importing them and
+# building their patch decorators on every run
+collect_ignore = ["test_music_endpoints.py"]
+
+# Router configuration read by the router tests
+ROUTER_CONFIG_PATH = Path(__file__).resolve().parents[2] / "config" / "router.config"
+
+
+@pytest.fixture(scope="session")
+def router_config() -> dict:
+    """Parse config/router.config once per test session."""
+    assert ROUTER_CONFIG_PATH.exists(), "router.config is missing"
+    return json.loads(ROUTER_CONFIG_PATH.read_text(encoding="utf-8"))
+
+
+def make_session_mock(first=None, all_=None) -> AsyncMock:
+    """
+    Build an AsyncSessionLocal() stand-in whose execute() result returns the given rows.
+    
+    ``first`` is returned by ``result.scalars().first()`` and ``all_`` by
+    ``result.scalars().all()``.
+    """
+    result = MagicMock()
+    result.scalars.return_value.first.return_value = first
+    result.scalars.return_value.all.return_value = all_ if all_ is not None else []
+    
+    session = AsyncMock()
+    session.execute.return_value = result
+    session.__aenter__.return_value = session
+    return session
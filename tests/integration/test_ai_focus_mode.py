@@ -1,19 +1,65 @@
 """Integration tests for AI Focus Mode endpoints and functionality."""
 import pytest
 import asyncio
+import statistics
 from httpx import AsyncClient
 from fastapi import status
 import time
+import uuid
+
+
+def _new_session_id() -> str:
+    """Unique AI Focus question session ID (the prefix is what the sessions endpoint filters on)."""
+    return f"ai-focus-question-{uuid.uuid4().hex}"
+
+
+@pytest.fixture
+def session_id() -> str:
+    """Fresh AI Focus session ID for one test."""
+    return _new_session_id()
+
+
+async def _first_audio_chunk(client: AsyncClient, text: str):
+    """
+    Request TTS audio and read only its first chunk; closing the stream early stops the
+    server generating the rest.
+    
+    Returns:
+        Tuple of (status code, content type, first chunk of the body)
+    """
+    async with client.stream("POST", "/api/ai/text-to-audio-stream", json={"text": text}) as response:
+        first_chunk = b""
+        async for chunk in response.aiter_bytes(chunk_size=4096):
+            first_chunk = chunk
+            break
+        return response.status_code, response.headers.get("content-type"), first_chunk
+
+
+async def _bench(coro_fn, n=5, warmup=1):
+    """
+    Time an async call with perf_counter_ns after discarding warm-up runs.
+    
+    Returns:
+        Tuple of (median nanoseconds over n timed runs, results of the timed runs)
+    """
+    for _ in range(warmup):
+        await coro_fn()
+    
+    samples = []
+    results = []
+    for _ in range(n):
+        start_ns = time.perf_counter_ns()
+        results.append(await coro_fn())
+        samples.append(time.perf_counter_ns() - start_ns)
+    return statistics.median(samples), results
 
 
 class TestAIFocusEndpoints:
     """Test AI Focus Mode API endpoints."""
     
     @pytest.mark.asyncio
-    async def test_create_ai_focus_session(self, client: AsyncClient, test_user):
+    async def test_create_ai_focus_session(self, client: AsyncClient, test_user, session_id):
         """Test creating a new AI Focus session."""
-        session_id = f"ai-focus-question-{int(time.time() * 1000)}"
-        
         response = await client.post(
             "/api/ai/focus/create-session",
             json={
@@ -29,10 +75,8 @@ class TestAIFocusEndpoints:
         assert data["session_id"] == session_id
     
     @pytest.mark.asyncio
-    async def test_save_ai_focus_message(self, client: AsyncClient, test_user):
+    async def test_save_ai_focus_message(self, client: AsyncClient, test_user, session_id):
         """Test saving an AI Focus message with question and answer."""
-        session_id = f"ai-focus-question-{int(time.time() * 1000)}"
-        
         # Create session first
         await client.post(
             "/api/ai/focus/create-session",
@@ -59,10 +103,8 @@ class TestAIFocusEndpoints:
         assert data["session_id"] == session_id
     
     @pytest.mark.asyncio
-    async def test_save_audio_file(self, client: AsyncClient, test_user):
+    async def test_save_audio_file(self, client: AsyncClient, test_user, session_id):
         """Test saving audio file metadata for a message."""
-        session_id = f"ai-focus-question-{int(time.time() * 1000)}"
-        
         # Create session
         await client.post(
             "/api/ai/focus/create-session",
@@ -98,27 +140,14 @@ class TestAIFocusEndpoints:
         assert "audio_file_path" in data
     
     @pytest.mark.asyncio
-    async def test_get_ai_focus_history(self, client: AsyncClient, test_user):
+    async def test_get_ai_focus_history(self, client: AsyncClient, test_user, seed_ai_focus_messages, session_id):
         """Test retrieving AI Focus conversation history."""
-        session_id = f"ai-focus-question-{int(time.time() * 1000)}"
-        
         # Create session and add messages
         await client.post(
             "/api/ai/focus/create-session",
             json={"session_id": session_id, "user_id": test_user["id"]}
         )
-        
-        await client.post(
-            "/api/ai/focus/save-message",
-            json={
-                "question": "Question 1",
-                "answer": "Answer 1",
-                "mode": "question",
-                "persona": "assistant",
-                "user_id": test_user["id"],
-                "session_id": session_id
-            }
-        )
+        await seed_ai_focus_messages(session_id, 1)
         
         # Get history
         response = await client.get(f"/api/ai/focus/history/{session_id}")
@@ -132,13 +161,14 @@ class TestAIFocusEndpoints:
     async def test_get_ai_focus_sessions(self, client: AsyncClient, test_user):
         """Test retrieving all AI Focus sessions for a user."""
         # Create multiple sessions
-        for i in range(3):
-            session_id = f"ai-focus-question-{int(time.time() * 1000)}-{i}"
-            await client.post(
+        session_ids = [_new_session_id() for _ in range(3)]
+        await asyncio.gather(*(
+            client.post(
                 "/api/ai/focus/create-session",
                 json={"session_id": session_id, "user_id": test_user["id"]}
             )
-            await asyncio.sleep(0.01)  # Small delay to ensure unique timestamps
+            for session_id in session_ids
+        ))
         
         # Get sessions
         response = await client.get(f"/api/ai/focus/sessions?user_id={test_user['id']}")
@@ -156,18 +186,14 @@ class TestTextToAudioStreaming:
     @pytest.mark.asyncio
     async def test_text_to_audio_stream_endpoint(self, client: AsyncClient):
         """Test the text-to-audio streaming endpoint."""
-        response = await client.post(
-            "/api/ai/text-to-audio-stream",
-            json={"text": "Hello, this is a test."}
-        )
+        status_code, content_type, first_chunk = await _first_audio_chunk(client, "Hello, this is a test.")
         
         # Should return streaming response
-        assert response.status_code == status.HTTP_200_OK
-        assert response.headers["content-type"] == "audio/mpeg"
+        assert status_code == status.HTTP_200_OK
+        assert content_type == "audio/mpeg"
         
         # Check that we receive audio data
-        content = await response.aread()
-        assert len(content) > 0
+        assert len(first_chunk) > 0
     
     @pytest.mark.asyncio
     async def test_text_to_audio_stream_empty_text(self, client: AsyncClient):
@@ -191,83 +217,72 @@ class TestTextToAudioStreaming:
             "Text with <html>tags</html> should work."
         ]
         
-        for text in test_texts:
-            response = await client.post(
-                "/api/ai/text-to-audio-stream",
-                json={"text": text}
-            )
-            
-            assert response.status_code == status.HTTP_200_OK
-            content = await response.aread()
-            assert len(content) > 0
+        # The requests are independent, so send them together
+        results = await asyncio.gather(*(_first_audio_chunk(client, text) for text in test_texts))
+        
+        for status_code, _, first_chunk in results:
+            assert status_code == status.HTTP_200_OK
+            assert len(first_chunk) > 0
 
 
 class TestAIFocusPerformance:
     """Performance tests for AI Focus Mode."""
     
     @pytest.mark.asyncio
-    async def test_message_save_performance(self, client: AsyncClient, test_user):
+    async def test_message_save_performance(self, client: AsyncClient, test_user, session_id):
         """Test message save performance."""
-        session_id = f"ai-focus-question-{int(time.time() * 1000)}"
-        
         await client.post(
             "/api/ai/focus/create-session",
             json={"session_id": session_id, "user_id": test_user["id"]}
         )
         
-        start_time = time.time()
-        
-        response = await client.post(
-            "/api/ai/focus/save-message",
-            json={
-                "question": "Performance test question",
-                "answer": "Performance test answer",
-                "mode": "question",
-                "persona": "assistant",
-                "user_id": test_user["id"],
-                "session_id": session_id
-            }
-        )
+        async def save_message():
+            return await client.post(
+                "/api/ai/focus/save-message",
+                json={
+                    "question": "Performance test question",
+                    "answer": "Performance test answer",
+                    "mode": "question",
+                    "persona": "assistant",
+                    "user_id": test_user["id"],
+                    "session_id": session_id
+                }
+            )
         
-        elapsed = time.time() - start_time
+        median_ns, responses = await _bench(save_message)
         
-        assert response.status_code == status.HTTP_200_OK
-        assert elapsed < 1.0  # Should complete within 1 second
+        assert all(response.status_code == status.HTTP_200_OK for response in responses)
+        assert median_ns < 200_000_000  # Should complete within 200ms
         
-        print(f"\n[PERF] Message save: {elapsed * 1000:.2f}ms")
+        print(f"\n[PERF] Message save (median of {len(responses)}): {median_ns / 1e6:.2f}ms")
     
     @pytest.mark.asyncio
-    async def test_history_retrieval_performance(self, client: AsyncClient, test_user):
+    async def test_history_retrieval_performance(self, client: AsyncClient, test_user, session_id):
         """Test history retrieval performance with multiple messages."""
-        session_id = f"ai-focus-question-{int(time.time() * 1000)}"
-        
         await client.post(
             "/api/ai/focus/create-session",
             json={"session_id": session_id, "user_id": test_user["id"]}
         )
         
-        # Add 10 messages
-        for i in range(10):
-            await client.post(
-                "/api/ai/focus/save-message",
-                json={
-                    "question": f"Question {i}",
-                    "answer": f"Answer {i}",
-                    "mode": "question",
-                    "persona": "assistant",
-                    "user_id": test_user["id"],
-                    "session_id": session_id
-                }
-            )
+        # Add 10 messages in one request
+        response = await client.post(
+            "/api/ai/focus/save-messages",
+            json={
+                "session_id": session_id,
+                "messages": [{"question": f"Question {i}", "answer": f"Answer {i}"} for i in range(10)],
+                "mode": "question",
+                "persona": "assistant",
+                "user_id": test_user["id"]
+            }
+        )
+        assert response.json()["saved"] == 10
         
-        start_time = time.time()
-        response = await client.get(f"/api/ai/focus/history/{session_id}")
-        elapsed = time.time() - start_time
+        median_ns, responses = await _bench(lambda: client.get(f"/api/ai/focus/history/{session_id}"))
         
-        assert response.status_code == status.HTTP_200_OK
-        assert elapsed < 0.5  # Should retrieve within 500ms
+        assert all(response.status_code == status.HTTP_200_OK for response in responses)
+        assert median_ns < 200_000_000  # Should retrieve within 200ms
         
-        print(f"\n[PERF] History retrieval (10 messages): {elapsed * 1000:.2f}ms")
+        print(f"\n[PERF] History retrieval (10 messages, median of {len(responses)}): {median_ns / 1e6:.2f}ms")
 
 
 class TestContextFiltering:
@@ -340,3 +355,24 @@ class TestTextCleaning:
         assert "<" not in result
         assert ">" not in result
         assert "Hello world" in result
+    
+    def test_cleaning_performance(self):
+        """Test that cleaning stays cheap enough for per-sentence streaming TTS."""
+        from utils.text_cleaner import clean_text_for_tts
+        
+        text = "**Note:** I'm sure it's <em>fine</em> - see [the docs](http://example.com) and don't worry!"
+        
+        assert clean_text_for_tts(text) == "Note: I am sure it is fine - see the docs and do not worry!"
+        
+        # Median of several batches, so one slow batch on a loaded machine doesn't fail the test
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            for _ in range(1000):
+                clean_text_for_tts(text)
+            timings.append(time.perf_counter() - start)
+        elapsed = statistics.median(timings)
+        
+        assert elapsed < 0.2  # 1000 sentences within 200ms
+        
+        print(f"\n[PERF] Text cleaning (1000 sentences, median of {len(timings)}): {elapsed * 1000:.2f}ms")
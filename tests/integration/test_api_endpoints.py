@@ -1,40 +1,40 @@
 """Integration tests for API endpoints."""
 import pytest
+import asyncio
 from unittest.mock import patch, AsyncMock
-from web.main import app
 
 
-@pytest.fixture
-def client():
-    """Create a test client."""
-    # Note: TestClient has compatibility issues with Starlette 0.27.0
-    # These tests are skipped until the issue is resolved
-    # See: https://github.com/encode/starlette/issues/...
-    pytest.skip(
-        "API endpoint integration tests skipped due to TestClient compatibility "
-        "issue with Starlette 0.27.0. Unit tests and WebSocket integration tests "
-        "are passing. To test API endpoints manually, use the running server."
-    )
+@pytest.fixture(autouse=True)
+def _test_database(db_session):
+    """
+    Run every test in this module on the rolled-back test database.
+    
+    Requesting db_session binds AsyncSessionLocal to the test transaction, so endpoints
+    never read from or write to the database configured in settings.
+    """
+    return db_session
 
 
 class TestChatEndpoints:
     """Test chat API endpoints."""
     
-    def test_get_chat_history(self, client, db_session):
+    @pytest.mark.asyncio
+    async def test_get_chat_history(self, client, db_session):
         """Test getting chat history."""
-        response = client.get("/api/chat?limit=10&offset=0")
+        response = await client.get("/api/chat?limit=10&offset=0")
         assert response.status_code == 200
         assert "messages" in response.json()
     
+    @pytest.mark.asyncio
     @patch('web.main.AIService')
-    def test_send_chat_message_qa_mode(self, mock_ai_service, client):
+    async def test_send_chat_message_qa_mode(self, mock_ai_service, client):
         """Test sending a chat message in Q&A mode."""
         # Mock AI service
         mock_service_instance = AsyncMock()
         mock_service_instance.stream_execute.return_value = iter(["Hello", " ", "world"])
         mock_ai_service.return_value = mock_service_instance
         
-        response = client.post(
+        response = await client.post(
             "/api/chat",
             json={
                 "message": "Hello",
@@ -46,8 +46,9 @@ class TestChatEndpoints:
         # Should return 200 or handle streaming
         assert response.status_code in [200, 500]  # 500 if service not properly mocked
     
+    @pytest.mark.asyncio
     @patch('web.main.RAGService')
-    def test_send_chat_message_conversational_mode(self, mock_rag_service, client):
+    async def test_send_chat_message_conversational_mode(self, mock_rag_service, client):
         """Test sending a chat message in conversational mode."""
         # Mock RAG service
         mock_service_instance = AsyncMock()
@@ -55,7 +56,7 @@ class TestChatEndpoints:
         mock_service_instance._load_conversation_history = AsyncMock(return_value=[])
         mock_rag_service.return_value = mock_service_instance
         
-        response = client.post(
+        response = await client.post(
             "/api/chat",
             json={
                 "message": "Hello",
@@ -72,96 +73,87 @@ class TestChatEndpoints:
 class TestSystemEndpoints:
     """Test system API endpoints."""
     
+    @pytest.mark.asyncio
     @patch('web.main.get_system_stats')
-    def test_get_system_stats(self, mock_stats, client):
-        """Test getting system stats."""
+    async def test_get_system_endpoints(self, mock_stats, client):
+        """Test getting system stats, uptime and IP addresses (requested together)."""
         mock_stats.return_value = {
             "cpu_percent": 50.0,
             "memory_percent": 60.0,
             "disk_percent": 70.0
         }
         
-        response = client.get("/api/system/stats")
-        assert response.status_code == 200
-        data = response.json()
-        assert "cpu_percent" in data
-    
-    def test_get_system_uptime(self, client):
-        """Test getting system uptime."""
-        response = client.get("/api/system/uptime")
-        assert response.status_code == 200
-        assert "uptime" in response.json() or "uptime_seconds" in response.json()
-    
-    def test_get_system_ips(self, client):
-        """Test getting system IP addresses."""
-        response = client.get("/api/system/ips")
-        assert response.status_code == 200
-        data = response.json()
+        stats, uptime, ips = await asyncio.gather(
+            client.get("/api/system/stats"),
+            client.get("/api/system/uptime"),
+            client.get("/api/system/ips")
+        )
+        
+        assert stats.status_code == 200
+        assert "cpu_percent" in stats.json()
+        
+        assert uptime.status_code == 200
+        assert "uptime" in uptime.json() or "uptime_seconds" in uptime.json()
+        
+        assert ips.status_code == 200
+        data = ips.json()
         assert "local_ip" in data or "remote_ip" in data
 
 
 class TestDeviceEndpoints:
     """Test device API endpoints."""
     
-    def test_get_devices(self, client):
+    @pytest.mark.asyncio
+    async def test_get_devices(self, client):
         """Test getting connected devices."""
-        response = client.get("/api/devices")
+        response = await client.get("/api/devices")
         assert response.status_code == 200
         assert isinstance(response.json(), list)
     
-    def test_get_device_health(self, client):
+    @pytest.mark.asyncio
+    async def test_get_device_health(self, client):
         """Test getting device health."""
-        response = client.get("/api/devices/health")
+        response = await client.get("/api/devices/health")
         assert response.status_code == 200
 
 
 class TestDataEndpoints:
     """Test data collection API endpoints."""
     
-    @patch('web.main.WeatherCollector')
-    def test_get_weather(self, mock_collector, client):
+    @pytest.mark.asyncio
+    async def test_get_weather(self, fake_weather, client):
         """Test getting weather data."""
-        mock_instance = AsyncMock()
-        mock_instance.collect = AsyncMock(return_value={"data": {"temperature": 20}})
-        mock_collector.return_value = mock_instance
-        
-        response = client.get("/api/weather")
+        response = await client.get("/api/weather")
         assert response.status_code in [200, 500]  # May fail if database locked
     
-    @patch('web.main.NewsCollector')
-    def test_get_news(self, mock_collector, client):
+    @pytest.mark.asyncio
+    async def test_get_news(self, fake_news, client):
         """Test getting news data."""
-        mock_instance = AsyncMock()
-        mock_instance.collect = AsyncMock(return_value={"articles": []})
-        mock_collector.return_value = mock_instance
-        
-        response = client.get("/api/news")
+        response = await client.get("/api/news")
         assert response.status_code in [200, 500]  # May fail if database locked
     
-    @patch('web.main.TrafficCollector')
-    def test_get_traffic(self, mock_collector, client):
+    @pytest.mark.asyncio
+    async def test_get_traffic(self, fake_traffic, client):
         """Test getting traffic data."""
-        mock_instance = AsyncMock()
-        mock_instance.collect = AsyncMock(return_value={"alerts": []})
-        mock_collector.return_value = mock_instance
-        
-        response = client.get("/api/traffic")
+        response = await client.get("/api/traffic")
         assert response.status_code in [200, 500]  # May fail if database locked
 
 
 class TestConfigEndpoints:
     """Test configuration API endpoints."""
     
-    def test_get_expert_types(self, client):
+    @pytest.mark.asyncio
+    async def test_get_expert_types(self, client):
         """Test getting expert types."""
-        response = client.get("/api/expert-types")
+        response = await client.get("/api/expert-types")
         assert response.status_code == 200
         data = response.json()
         assert "expert_types" in data or isinstance(data, list)
     
-    def test_get_personas(self, client):
+    @pytest.mark.asyncio
+    async def test_get_personas(self, client):
         """Test getting personas."""
-        response = client.get("/api/personas")
+        response = await client.get("/api/personas")
         assert response.status_code == 200
         data = response.json()
         assert "personas" in data or isinstance(data, list)
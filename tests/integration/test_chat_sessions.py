@@ -4,6 +4,10 @@ from unittest.mock import patch, AsyncMock
 from database.models import ChatSession, PromptPreset
 from database.base import AsyncSessionLocal
 from sqlalchemy import select
+from tests.conftest import bulk_create
+
+# Keep this module on one worker under `pytest -n auto --dist=loadgroup`
+pytestmark = pytest.mark.xdist_group(name="chat_sessions")
 
 
 class TestChatSessionEndpoints:
@@ -18,7 +22,7 @@ class TestChatSessionEndpoints:
             title="Test Session"
         )
         db_session.add(session_obj)
-        await db_session.commit()
+        await db_session.flush()
         session_id = session_obj.session_id
         
         # Toggle pin to True
@@ -31,10 +35,6 @@ class TestChatSessionEndpoints:
         assert data["success"] is True
         assert data["pinned"] is True
         
-        # Verify in database
-        await db_session.refresh(session_obj)
-        assert session_obj.pinned is True
-        
         # Toggle pin to False
         response = await test_client.put(
             f"/api/chat/sessions/{session_id}/pin",
@@ -44,33 +44,28 @@ class TestChatSessionEndpoints:
         data = response.json()
         assert data["pinned"] is False
         
-        # Verify in database
-        await db_session.refresh(session_obj)
-        assert session_obj.pinned is False
+        # Verify the final state in the database with one query
+        result = await db_session.execute(
+            select(ChatSession.pinned).where(ChatSession.session_id == session_id)
+        )
+        assert result.scalar_one() is False
     
     @pytest.mark.asyncio
     async def test_update_chat_session_preset(self, test_client, db_session):
         """Test updating chat session preset."""
-        # Create a prompt preset first
-        preset_response = await test_client.post(
-            "/api/prompt-presets",
-            json={
-                "name": "Test Preset",
-                "context": "You are a helpful assistant.",
-                "temperature": 0.7,
-                "top_p": 0.9
-            }
+        # Create a prompt preset and a chat session directly in the database
+        preset = PromptPreset(
+            name="Test Preset",
+            context="You are a helpful assistant.",
+            temperature=0.7,
+            top_p=0.9
         )
-        assert preset_response.status_code == 200
-        preset_id = preset_response.json()["preset"]["id"]
-        
-        # Create a chat session
         session_obj = ChatSession(
             session_id="test-session-preset",
             title="Test Session"
         )
-        db_session.add(session_obj)
-        await db_session.commit()
+        await bulk_create(db_session, [preset, session_obj])
+        preset_id = preset.id
         session_id = session_obj.session_id
         
         # Update preset
@@ -83,10 +78,6 @@ class TestChatSessionEndpoints:
         assert data["success"] is True
         assert data["preset_id"] == preset_id
         
-        # Verify in database
-        await db_session.refresh(session_obj)
-        assert session_obj.preset_id == preset_id
-        
         # Clear preset (set to None)
         response = await test_client.put(
             f"/api/chat/sessions/{session_id}/preset",
@@ -96,9 +87,11 @@ class TestChatSessionEndpoints:
         data = response.json()
         assert data["preset_id"] is None
         
-        # Verify in database
-        await db_session.refresh(session_obj)
-        assert session_obj.preset_id is None
+        # Verify the final state in the database with one query
+        result = await db_session.execute(
+            select(ChatSession.preset_id).where(ChatSession.session_id == session_id)
+        )
+        assert result.scalar_one() is None
     
     @pytest.mark.asyncio
     async def test_get_chat_sessions_with_pinned(self, test_client, db_session):
@@ -115,9 +108,7 @@ class TestChatSessionEndpoints:
             title="Pinned Session",
             pinned=True
         )
-        db_session.add(session1)
-        db_session.add(session2)
-        await db_session.commit()
+        await bulk_create(db_session, [session1, session2])
         
         # Get sessions
         response = await test_client.get("/api/chat/sessions")
@@ -131,67 +122,44 @@ class TestChatSessionEndpoints:
         else:
             sessions = data
         
-        # Find our test sessions
-        pinned_session = next((s for s in sessions if s.get("session_id") == "chat-pinned-test"), None)
-        unpinned_session = next((s for s in sessions if s.get("session_id") == "chat-unpinned-test"), None)
+        # Index sessions by id (with their position) in a single pass
+        by_id = {s.get("session_id"): (i, s) for i, s in enumerate(sessions)}
+        pinned_index, pinned_session = by_id.get("chat-pinned-test", (-1, None))
+        unpinned_index, unpinned_session = by_id.get("chat-unpinned-test", (-1, None))
         
         assert pinned_session is not None, "Pinned session not found in response"
         assert unpinned_session is not None, "Unpinned session not found in response"
         assert pinned_session.get("pinned") is True
         assert unpinned_session.get("pinned") is False
         
-        # Pinned sessions should appear before unpinned (check order)
-        pinned_index = next((i for i, s in enumerate(sessions) if s.get("session_id") == "chat-pinned-test"), -1)
-        unpinned_index = next((i for i, s in enumerate(sessions) if s.get("session_id") == "chat-unpinned-test"), -1)
-        
-        # If both exist in the list, pinned should come first
-        if pinned_index >= 0 and unpinned_index >= 0:
-            assert pinned_index < unpinned_index, "Pinned session should appear before unpinned"
-    
-    @pytest.mark.asyncio
-    async def test_toggle_pin_nonexistent_session(self, test_client):
-        """Test toggling pin on non-existent session creates it."""
-        # The API creates a session if it doesn't exist, so this should succeed
-        response = await test_client.put(
-            "/api/chat/sessions/nonexistent-session-pin/pin",
-            json={"pinned": True}
-        )
-        # API creates session if it doesn't exist, so this should return 200
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert data["pinned"] is True
+        # Pinned sessions should appear before unpinned
+        assert pinned_index < unpinned_index, "Pinned session should appear before unpinned"
     
     @pytest.mark.asyncio
-    async def test_update_preset_nonexistent_session(self, test_client):
-        """Test updating preset on non-existent session creates it."""
-        # The API creates a session if it doesn't exist
-        response = await test_client.put(
-            "/api/chat/sessions/nonexistent-session-preset/preset",
-            json={"preset_id": None}
-        )
-        # API creates session if it doesn't exist, so this should return 200
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-    
-    @pytest.mark.asyncio
-    async def test_update_preset_with_invalid_preset_id(self, test_client, db_session):
-        """Test updating preset with invalid preset_id."""
-        # Create a chat session
-        session_obj = ChatSession(
-            session_id="test-session-invalid-preset",
-            title="Test Session"
-        )
-        db_session.add(session_obj)
-        await db_session.commit()
-        session_id = session_obj.session_id
-        
-        # Try to set invalid preset_id - API may allow this or return error
-        response = await test_client.put(
-            f"/api/chat/sessions/{session_id}/preset",
-            json={"preset_id": 99999}  # Non-existent preset
-        )
-        # API may allow invalid preset_id (foreign key constraint may not be enforced)
-        # or return 400/404/500 depending on implementation
-        assert response.status_code in [200, 400, 404, 500]
+    @pytest.mark.parametrize(
+        "session_id,action,body,seed,expected",
+        [
+            # The API creates the session if it doesn't exist
+            ("nonexistent-session-pin", "pin", {"pinned": True}, False, [200]),
+            ("nonexistent-session-preset", "preset", {"preset_id": None}, False, [200]),
+            # API may allow an invalid preset_id (foreign key constraint may not be enforced)
+            # or return 400/404/500 depending on implementation
+            ("test-session-invalid-preset", "preset", {"preset_id": 99999}, True, [200, 400, 404, 500]),
+        ],
+        ids=["pin-nonexistent-session", "preset-nonexistent-session", "invalid-preset-id"],
+    )
+    async def test_update_session_edge_cases(
+        self, test_client, db_session, session_id, action, body, seed, expected
+    ):
+        """Test pin/preset updates on missing sessions and with an invalid preset_id."""
+        if seed:
+            db_session.add(ChatSession(session_id=session_id, title="Test Session"))
+            await db_session.flush()
+        
+        response = await test_client.put(f"/api/chat/sessions/{session_id}/{action}", json=body)
+        assert response.status_code in expected
+        if expected == [200]:
+            data = response.json()
+            assert data["success"] is True
+            if "pinned" in body:
+                assert data["pinned"] is body["pinned"]
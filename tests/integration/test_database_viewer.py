@@ -3,45 +3,53 @@ import pytest
 from database.base import AsyncSessionLocal
 from database.models import ChatSession
 
+# Keep this module on one worker under `pytest -n auto --dist=loadgroup`
+pytestmark = pytest.mark.xdist_group(name="db_viewer")
+
+# Tables the database viewer must always list
+EXPECTED_TABLES = frozenset({
+    "chat_sessions",
+    "chat_messages",
+    "prompt_presets",
+    "music_artists",
+    "music_albums",
+    "music_songs",
+    "device_connections",
+    "collected_data",
+    "system_config",
+    "api_keys_config",
+    "location_config",
+    "persona_configs",
+    "router_config",
+    "expert_types_config",
+    "alarms",
+    "article_summaries",
+})
+
+
+@pytest.fixture(scope="module")
+async def database_tables_payload(test_client) -> dict:
+    """Fetch /api/database/tables once for the read-only table listing tests."""
+    response = await test_client.get("/api/database/tables")
+    assert response.status_code == 200
+    return response.json()
+
 
 class TestDatabaseViewerEndpoints:
     """Test database viewer API endpoints."""
     
     @pytest.mark.asyncio
-    async def test_get_database_tables(self, test_client):
+    async def test_get_database_tables(self, database_tables_payload):
         """Test getting all database tables."""
-        response = await test_client.get("/api/database/tables")
-        assert response.status_code == 200
-        data = response.json()
+        data = database_tables_payload
         assert data["success"] is True
         assert "tables" in data
         assert isinstance(data["tables"], list)
         
-        # Get table names
-        table_names = [table["name"] for table in data["tables"]]
-        
         # Verify key tables are present
-        expected_tables = [
-            "chat_sessions",
-            "chat_messages",
-            "prompt_presets",
-            "music_artists",
-            "music_albums",
-            "music_songs",
-            "device_connections",
-            "collected_data",
-            "system_config",
-            "api_keys_config",
-            "location_config",
-            "persona_configs",
-            "router_config",
-            "expert_types_config",
-            "alarms",
-            "article_summaries"
-        ]
-        
-        for expected_table in expected_tables:
-            assert expected_table in table_names, f"Table {expected_table} not found in database tables"
+        table_names = {table["name"] for table in data["tables"]}
+        missing = EXPECTED_TABLES - table_names
+        assert not missing, f"Tables not found in database tables: {sorted(missing)}"
     
     @pytest.mark.asyncio
     async def test_get_table_data(self, test_client, db_session):
@@ -53,7 +61,7 @@ class TestDatabaseViewerEndpoints:
             title="Test Session for DB Viewer"
         )
         db_session.add(test_session)
-        await db_session.commit()
+        await db_session.flush()
         
         # Get data from chat_sessions table
         response = await test_client.get("/api/database/tables/chat_sessions/data?page=1&limit=10")
@@ -87,23 +95,19 @@ class TestDatabaseViewerEndpoints:
         assert response.status_code == 404
     
     @pytest.mark.asyncio
-    async def test_table_columns_info(self, test_client):
+    async def test_table_columns_info(self, database_tables_payload):
         """Test that table info includes column information."""
-        response = await test_client.get("/api/database/tables")
-        assert response.status_code == 200
-        data = response.json()
+        data = database_tables_payload
         
-        # Find chat_sessions table
-        chat_sessions_table = next(
-            (t for t in data["tables"] if t["name"] == "chat_sessions"),
-            None
-        )
-        assert chat_sessions_table is not None
-        assert "columns" in chat_sessions_table
-        assert len(chat_sessions_table["columns"]) > 0
+        # Index tables by name once
+        tables = {t["name"]: t for t in data["tables"]}
+        
+        for table_name in EXPECTED_TABLES:
+            assert table_name in tables, f"Table {table_name} not found in database tables"
+            assert len(tables[table_name]["columns"]) > 0
         
         # Check column structure
-        column = chat_sessions_table["columns"][0]
+        column = tables["chat_sessions"]["columns"][0]
         assert "name" in column
         assert "type" in column
         assert "nullable" in column
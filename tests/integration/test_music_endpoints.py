@@ -1,19 +1,55 @@
 """Integration tests for Music API endpoints."""
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 import os
 
+from tests.integration.conftest import make_session_mock
+
+# Note: TestClient has compatibility issues with Starlette 0.27.0
+# These tests are skipped until the issue is resolved
+pytestmark = pytest.mark.skip(
+    reason="Music API endpoint integration tests skipped due to TestClient compatibility "
+    "issue with Starlette 0.27.0. To test API endpoints manually, use the running server."
+)
+
+
+# Plain row stand-ins for the popular songs tests; cheaper than nested MagicMocks
+@dataclass
+class _Song:
+    title: str
+    path: str
+    track_number: int
+
+
+@dataclass
+class _Album:
+    title: str
+    songs: List[_Song]
+
+
+@dataclass
+class _Artist:
+    id: int
+    albums: List[_Album]
+    extra_metadata: Optional[Dict[str, Any]] = None
+
+
+# os.walk results for the scan edge-case tests
+WALK_CORRUPT_FILE = [('/Music/Artist/Album', [], ['corrupt.mp3'])]
+WALK_SPECIAL_CHARACTERS = [
+    ('/Music/Artist (feat. Other)/Album [2024]/01 - Song & Title.mp3', [], ['song.mp3']),
+]
+
 
 @pytest.fixture
-def client():
-    """Create a test client."""
-    # Note: TestClient has compatibility issues with Starlette 0.27.0
-    # These tests are skipped until the issue is resolved
-    pytest.skip(
-        "Music API endpoint integration tests skipped due to TestClient compatibility "
-        "issue with Starlette 0.27.0. To test API endpoints manually, use the running server."
-    )
+def scan_env():
+    """Patch os.walk and Path.exists for the library scan; yields (walk, exists) mocks."""
+    with patch('web.main.os.walk') as mock_walk, \
+            patch('web.main.Path.exists', return_value=True) as mock_exists:
+        yield mock_walk, mock_exists
 
 
 class TestMusicScanEndpoint:
@@ -63,18 +99,6 @@ class TestMusicScanEndpoint:
 class TestMusicStreamEndpoint:
     """Test music streaming endpoint."""
     
-    @patch('web.main.Path.exists')
-    @patch('builtins.open', create=True)
-    def test_stream_music_file_success(self, mock_open, mock_exists, client):
-        """Test successful music file streaming."""
-        mock_exists.return_value = True
-        mock_file = MagicMock()
-        mock_file.read.return_value = b"fake mp3 data"
-        mock_open.return_value.__enter__.return_value = mock_file
-        
-        response = client.get("/api/music/stream?path=Artist/Album/song.mp3")
-        assert response.status_code == 200
-    
     def test_stream_music_file_not_found(self, client):
         """Test streaming when file doesn't exist."""
         with patch('web.main.Path.exists', return_value=False):
@@ -128,16 +152,13 @@ class TestMusicPopularEndpoints:
     def test_get_popular_songs_cached(self, mock_session, client):
         """Test getting cached popular songs."""
         # Mock database response with cached popular songs
-        mock_artist = MagicMock()
-        mock_artist.extra_metadata = {"popular": [{"title": "Hit Song", "path": "song.mp3"}]}
-        
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.first.return_value = mock_artist
+        mock_artist = _Artist(
+            id=1,
+            albums=[],
+            extra_metadata={"popular": [{"title": "Hit Song", "path": "song.mp3"}]}
+        )
         
-        mock_session_instance = AsyncMock()
-        mock_session_instance.execute.return_value = mock_result
-        mock_session_instance.__aenter__.return_value = mock_session_instance
-        mock_session.return_value = mock_session_instance
+        mock_session.return_value = make_session_mock(first=mock_artist)
         
         response = client.get("/api/music/popular?artist=TestArtist")
         assert response.status_code == 200
@@ -148,13 +169,7 @@ class TestMusicPopularEndpoints:
     @patch('web.main.AsyncSessionLocal')
     def test_get_popular_artist_not_found(self, mock_session, client):
         """Test getting popular songs for non-existent artist."""
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.first.return_value = None
-        
-        mock_session_instance = AsyncMock()
-        mock_session_instance.execute.return_value = mock_result
-        mock_session_instance.__aenter__.return_value = mock_session_instance
-        mock_session.return_value = mock_session_instance
+        mock_session.return_value = make_session_mock(first=None)
         
         response = client.get("/api/music/popular?artist=NonExistentArtist")
         assert response.status_code == 200
@@ -168,22 +183,14 @@ class TestMusicPopularEndpoints:
     def test_generate_popular_songs(self, mock_session, mock_rag, mock_ai, client):
         """Test generating popular songs with AI."""
         # Mock artist with albums
-        mock_artist = MagicMock()
-        mock_artist.id = 1
-        mock_artist.albums = [
-            MagicMock(title="Album 1", songs=[
-                MagicMock(title="Song 1", path="s1.mp3", track_number=1),
-                MagicMock(title="Song 2", path="s2.mp3", track_number=2)
+        mock_artist = _Artist(id=1, albums=[
+            _Album(title="Album 1", songs=[
+                _Song(title="Song 1", path="s1.mp3", track_number=1),
+                _Song(title="Song 2", path="s2.mp3", track_number=2)
             ])
-        ]
-        
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.first.return_value = mock_artist
+        ])
         
-        mock_session_instance = AsyncMock()
-        mock_session_instance.execute.return_value = mock_result
-        mock_session_instance.__aenter__.return_value = mock_session_instance
-        mock_session.return_value = mock_session_instance
+        mock_session.return_value = make_session_mock(first=mock_artist)
         
         # Mock AI service
         mock_ai_instance = AsyncMock()
@@ -200,13 +207,7 @@ class TestMusicPlaylistEndpoints:
     @patch('web.main.AsyncSessionLocal')
     def test_list_playlists_empty(self, mock_session, client):
         """Test listing playlists when none exist."""
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.all.return_value = []
-        
-        mock_session_instance = AsyncMock()
-        mock_session_instance.execute.return_value = mock_result
-        mock_session_instance.__aenter__.return_value = mock_session_instance
-        mock_session.return_value = mock_session_instance
+        mock_session.return_value = make_session_mock(all_=[])
         
         response = client.get("/api/music/playlists")
         assert response.status_code == 200
@@ -217,9 +218,7 @@ class TestMusicPlaylistEndpoints:
     @patch('web.main.AsyncSessionLocal')
     def test_create_playlist_success(self, mock_session, client):
         """Test creating a new playlist."""
-        mock_session_instance = AsyncMock()
-        mock_session_instance.__aenter__.return_value = mock_session_instance
-        mock_session.return_value = mock_session_instance
+        mock_session.return_value = make_session_mock()
         
         response = client.post(
             "/api/music/playlists",
@@ -240,13 +239,7 @@ class TestMusicPlaylistEndpoints:
         mock_playlist = MagicMock()
         mock_playlist.id = 1
         
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.first.return_value = mock_playlist
-        
-        mock_session_instance = AsyncMock()
-        mock_session_instance.execute.return_value = mock_result
-        mock_session_instance.__aenter__.return_value = mock_session_instance
-        mock_session.return_value = mock_session_instance
+        mock_session.return_value = make_session_mock(first=mock_playlist)
         
         response = client.post(
             "/api/music/playlists/add",
@@ -266,13 +259,7 @@ class TestMusicPlaylistEndpoints:
     @patch('web.main.AsyncSessionLocal')
     def test_add_song_creates_new_playlist(self, mock_session, client):
         """Test that adding a song to non-existent playlist creates it."""
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.first.return_value = None
-        
-        mock_session_instance = AsyncMock()
-        mock_session_instance.execute.return_value = mock_result
-        mock_session_instance.__aenter__.return_value = mock_session_instance
-        mock_session.return_value = mock_session_instance
+        mock_session.return_value = make_session_mock(first=None)
         
         response = client.post(
             "/api/music/playlists/add",
@@ -288,28 +275,23 @@ class TestMusicEdgeCases:
     """Test edge cases and error handling."""
     
     @patch('web.main._extract_audio_meta')
-    def test_scan_handles_corrupted_files(self, mock_extract, client):
+    def test_scan_handles_corrupted_files(self, mock_extract, scan_env, client):
         """Test scan handles corrupted MP3 files gracefully."""
         mock_extract.side_effect = Exception("Corrupt file")
+        mock_walk, _ = scan_env
+        mock_walk.return_value = WALK_CORRUPT_FILE
         
-        with patch('web.main.os.walk') as mock_walk:
-            mock_walk.return_value = [
-                ('/Music/Artist/Album', [], ['corrupt.mp3']),
-            ]
-            with patch('web.main.Path.exists', return_value=True):
-                response = client.get("/api/music/scan")
-                # Should still succeed, just skip the corrupt file
-                assert response.status_code == 200
+        response = client.get("/api/music/scan")
+        # Should still succeed, just skip the corrupt file
+        assert response.status_code == 200
     
-    def test_scan_handles_special_characters_in_paths(self, client):
+    def test_scan_handles_special_characters_in_paths(self, scan_env, client):
         """Test scan handles special characters in file/folder names."""
-        with patch('web.main.os.walk') as mock_walk:
-            mock_walk.return_value = [
-                ('/Music/Artist (feat. Other)/Album [2024]/01 - Song & Title.mp3', [], ['song.mp3']),
-            ]
-            with patch('web.main.Path.exists', return_value=True):
-                response = client.get("/api/music/scan")
-                assert response.status_code == 200
+        mock_walk, _ = scan_env
+        mock_walk.return_value = WALK_SPECIAL_CHARACTERS
+        
+        response = client.get("/api/music/scan")
+        assert response.status_code == 200
     
     def test_stream_handles_absolute_paths(self, client):
         """Test streaming with absolute paths."""
@@ -323,13 +305,7 @@ class TestMusicEdgeCases:
         mock_artist = MagicMock()
         mock_artist.albums = []
         
-        mock_result = MagicMock()
-        mock_result.scalars.return_value.first.return_value = mock_artist
-        
-        mock_session_instance = AsyncMock()
-        mock_session_instance.execute.return_value = mock_result
-        mock_session_instance.__aenter__.return_value = mock_session_instance
-        mock_session.return_value = mock_session_instance
+        mock_session.return_value = make_session_mock(first=mock_artist)
         
         response = client.post("/api/music/popular?artist=TestArtist")
         # Should handle gracefully, not crash
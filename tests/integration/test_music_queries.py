@@ -0,0 +1,61 @@
+"""Query-count regression tests for music endpoints backed by a real database session."""
+import pytest
+from unittest.mock import patch, AsyncMock
+from sqlalchemy import event
+from database.models import MusicArtist, MusicAlbum, MusicSong
+from tests.conftest import bulk_create
+
+
+# Statements that do real work; SAVEPOINT/RELEASE from the test transaction are ignored
+COUNTED_STATEMENTS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+
+
+class TestMusicPopularQueries:
+    """Guard the popular songs endpoints against per-album/per-song lazy loads."""
+
+    @pytest.mark.asyncio
+    async def test_generate_popular_songs_no_n_plus_1(self, test_client, db_session, db_engine):
+        """Test generating popular songs issues a fixed number of queries regardless of library size."""
+        artist = MusicArtist(name="Query Count Artist")
+        rows = [artist]
+        for a in range(3):
+            album = MusicAlbum(artist=artist, title=f"Album {a}")
+            rows.append(album)
+            for t in range(5):
+                rows.append(MusicSong(
+                    artist=artist,
+                    album=album,
+                    title=f"Song {a}-{t}",
+                    track_number=t + 1,
+                    file_path=f"Query Count Artist/Album {a}/{t + 1:02d}.mp3"
+                ))
+        await bulk_create(db_session, rows)
+
+        statements = []
+
+        def _count(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith(COUNTED_STATEMENTS):
+                statements.append(statement)
+
+        mock_ai = AsyncMock()
+        mock_ai.execute_with_system_prompt.return_value = {
+            "answer": '{"songs": [{"title": "Song 0-0", "album": "Album 0"}]}'
+        }
+
+        event.listen(db_engine.sync_engine, "before_cursor_execute", _count)
+        try:
+            with patch('web.main.AIService', return_value=mock_ai):
+                response = await test_client.post(
+                    "/api/music/popular",
+                    json={"artist": "Query Count Artist"}
+                )
+        finally:
+            event.remove(db_engine.sync_engine, "before_cursor_execute", _count)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["success"] is True
+        assert [s["title"] for s in data["popular"]] == ["Song 0-0"]
+
+        # Artist lookup, one song/album join and the metadata UPDATE
+        assert len(statements) <= 3, statements
@@ -0,0 +1,40 @@
+"""Integration tests for streaming music files from the library."""
+import pytest
+from unittest.mock import patch, AsyncMock
+
+
+# Two chunks' worth of fake MP3 data, larger than a single read
+FAKE_MP3_CHUNKS = (b"a" * 8192, b"b" * 8192)
+
+
+@pytest.fixture
+def music_dir(tmp_path):
+    """Point the music library at a temp directory holding one fake MP3."""
+    song = tmp_path / "Artist" / "Album" / "song.mp3"
+    song.parent.mkdir(parents=True)
+    song.write_bytes(b"".join(FAKE_MP3_CHUNKS))
+    with patch('web.main._get_music_directory', AsyncMock(return_value=tmp_path)):
+        yield tmp_path
+
+
+class TestMusicStreamEndpoint:
+    """Test music streaming endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_stream_music_file_success(self, test_client, music_dir):
+        """Test a music file is streamed back in chunks with the right content type."""
+        received = 0
+        async with test_client.stream("GET", "/api/music/stream?path=Artist/Album/song.mp3") as response:
+            assert response.status_code == 200
+            assert response.headers.get("content-type") == "audio/mpeg"
+            async for chunk in response.aiter_bytes():
+                received += len(chunk)
+
+        assert received == sum(len(c) for c in FAKE_MP3_CHUNKS)
+        assert int(response.headers["content-length"]) == received
+
+    @pytest.mark.asyncio
+    async def test_stream_music_file_not_found(self, test_client, music_dir):
+        """Test streaming when file doesn't exist."""
+        response = await test_client.get("/api/music/stream?path=Artist/Album/missing.mp3")
+        assert response.status_code == 404
@@ -4,6 +4,18 @@ from unittest.mock import patch, AsyncMock
 from database.models import PromptPreset
 from database.base import AsyncSessionLocal
 from sqlalchemy import select
+from tests.conftest import bulk_create
+
+
+@pytest.fixture(autouse=True)
+def _test_database(db_session):
+    """
+    Run every test in this module on the rolled-back test database.
+    
+    Requesting db_session binds AsyncSessionLocal to the test transaction, so presets
+    created through the endpoints never reach the database configured in settings.
+    """
+    return db_session
 
 
 class TestPromptPresetEndpoints:
@@ -31,18 +43,14 @@ class TestPromptPresetEndpoints:
         assert data["preset"]["top_p"] == 0.9
     
     @pytest.mark.asyncio
-    async def test_get_prompt_presets(self, test_client):
+    async def test_get_prompt_presets(self, test_client, db_session):
         """Test getting all prompt presets."""
-        # Create a preset first
-        await test_client.post(
-            "/api/prompt-presets",
-            json={
-                "name": "Test Preset 2",
-                "context": "Test context",
-                "temperature": 0.8,
-                "top_p": 0.95
-            }
-        )
+        # Seed in a single flush; the endpoints share db_session's connection, so
+        # concurrent POSTs would interleave statements on it
+        await bulk_create(db_session, [
+            PromptPreset(name="Test Preset 2", context="Test context", temperature=0.8, top_p=0.95),
+            PromptPreset(name="Test Preset 3", context="Another context", temperature=0.5, top_p=0.9),
+        ])
         
         response = await test_client.get("/api/prompt-presets")
         assert response.status_code == 200
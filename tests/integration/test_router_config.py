@@ -1,16 +1,6 @@
-import json
-from pathlib import Path
-
-
-def test_router_config_examples_present():
+def test_router_config_examples_present(router_config):
     """Ensure router.config includes the example routing rules described in the prompt."""
-    cfg_path = Path(__file__).resolve().parent.parent.parent / "config" / "router.config"
-    assert cfg_path.exists(), "router.config is missing"
-
-    with cfg_path.open("r", encoding="utf-8") as f:
-        cfg = json.load(f)
-
-    anth = cfg.get("anthropic", {})
+    anth = router_config.get("anthropic", {})
     prompt = anth.get("prompt_context", "")
     assert prompt, "prompt_context missing in router.config"
 
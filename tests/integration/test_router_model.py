@@ -1,6 +1,4 @@
-import json
 import os
-from pathlib import Path
 
 import pytest
 
@@ -10,19 +8,13 @@ except ImportError:  # pragma: no cover
     Anthropic = None
 
 
-ROUTER_CONFIG_PATH = Path(__file__).resolve().parent.parent.parent / "config" / "router.config"
-
-
 @pytest.mark.skipif(
     Anthropic is None or not os.getenv("ANTHROPIC_API_KEY"),
     reason="Anthropic client or API key not available",
 )
-def test_router_model_classifies_get_time():
+def test_router_model_classifies_get_time(router_config):
     """Call Anthropic using router.config and verify 'get time' is classified as task/get_time."""
-    with ROUTER_CONFIG_PATH.open("r", encoding="utf-8") as f:
-        cfg = json.load(f)
-
-    anth = cfg.get("anthropic", {})
+    anth = router_config.get("anthropic", {})
     api_key = os.getenv("ANTHROPIC_API_KEY")
 
     client = Anthropic(api_key=api_key)
@@ -3,18 +3,33 @@ import pytest
 from services.tmdb_service import TMDBService
 
 
+# Use the user's API key
+TMDB_TEST_API_KEY = "caa2360ec72462ade320d249304deb58"
+
+
+@pytest.fixture(scope="session")
+def tmdb_service() -> TMDBService:
+    """
+    One TMDBService for all valid-key tests, so they share its requests.Session and reuse
+    the pooled HTTPS connection to api.themoviedb.org instead of a new TLS handshake each.
+    """
+    return TMDBService(TMDB_TEST_API_KEY)
+
+
+@pytest.fixture(scope="session")
+def breaking_bad(tmdb_service):
+    """Search TMDB for Breaking Bad once; shared by the TV show tests."""
+    return tmdb_service.search_tv_show("Breaking Bad")
+
+
 @pytest.mark.asyncio
 class TestTMDBService:
     """Test TMDB API integration."""
     
-    def test_search_movie_with_valid_key(self):
+    def test_search_movie_with_valid_key(self, tmdb_service):
         """Test searching for a movie with a valid API key."""
-        # Use the user's API key
-        api_key = "caa2360ec72462ade320d249304deb58"
-        tmdb = TMDBService(api_key)
-        
         # Search for a well-known movie
-        result = tmdb.search_movie("The Matrix", 1999)
+        result = tmdb_service.search_movie("The Matrix", 1999)
         
         assert result is not None, "Movie search should return results"
         assert result["title"] == "The Matrix"
@@ -27,13 +42,10 @@ class TestTMDBService:
         print(f"  Poster: {result['poster_path']}")
         print(f"  Description: {result['description'][:100]}...")
     
-    def test_search_tv_show_with_valid_key(self):
+    def test_search_tv_show_with_valid_key(self, breaking_bad):
         """Test searching for a TV show with a valid API key."""
-        api_key = "caa2360ec72462ade320d249304deb58"
-        tmdb = TMDBService(api_key)
-        
         # Search for a well-known TV show
-        result = tmdb.search_tv_show("Breaking Bad")
+        result = breaking_bad
         
         assert result is not None, "TV show search should return results"
         assert "Breaking Bad" in result["title"]
@@ -46,17 +58,14 @@ class TestTMDBService:
         print(f"  Seasons: {result['number_of_seasons']}")
         print(f"  Poster: {result['poster_path']}")
     
-    def test_get_tv_season_details(self):
+    def test_get_tv_season_details(self, tmdb_service, breaking_bad):
         """Test getting TV season details."""
-        api_key = "caa2360ec72462ade320d249304deb58"
-        tmdb = TMDBService(api_key)
-        
         # Get Breaking Bad first
-        show = tmdb.search_tv_show("Breaking Bad")
+        show = breaking_bad
         assert show is not None
         
         # Get season 1 details
-        season = tmdb.get_tv_season_details(show["tmdb_id"], 1)
+        season = tmdb_service.get_tv_season_details(show["tmdb_id"], 1)
         
         assert season is not None, "Season details should be returned"
         assert season["season_number"] == 1
@@ -65,13 +74,10 @@ class TestTMDBService:
         print(f"  Episodes: {len(season['episodes'])}")
         print(f"  Episode 1: {season['episodes'][0]['name']}")
     
-    def test_search_movie_not_found(self):
+    def test_search_movie_not_found(self, tmdb_service):
         """Test searching for a non-existent movie."""
-        api_key = "caa2360ec72462ade320d249304deb58"
-        tmdb = TMDBService(api_key)
-        
         # Search for a movie that doesn't exist
-        result = tmdb.search_movie("ThisMovieDoesNotExist12345xyz", 2099)
+        result = tmdb_service.search_movie("ThisMovieDoesNotExist12345xyz", 2099)
         
         assert result is None, "Non-existent movie should return None"
         print("✓ Correctly handled non-existent movie")
@@ -96,13 +102,10 @@ class TestTMDBService:
         assert result is None, "No API key should return None"
         print("✓ Correctly handled missing API key")
     
-    def test_search_movie_without_year(self):
+    def test_search_movie_without_year(self, tmdb_service):
         """Test searching for a movie without specifying year."""
-        api_key = "caa2360ec72462ade320d249304deb58"
-        tmdb = TMDBService(api_key)
-        
         # Search without year - should still work
-        result = tmdb.search_movie("Inception")
+        result = tmdb_service.search_movie("Inception")
         
         assert result is not None, "Movie search without year should work"
         assert "Inception" in result["title"]
@@ -118,15 +121,17 @@ if __name__ == "__main__":
     print("="*60 + "\n")
     
     test = TestTMDBService()
+    tmdb = TMDBService(TMDB_TEST_API_KEY)
+    show = tmdb.search_tv_show("Breaking Bad")
     
     tests = [
-        ("Movie Search", test.test_search_movie_with_valid_key),
-        ("TV Show Search", test.test_search_tv_show_with_valid_key),
-        ("TV Season Details", test.test_get_tv_season_details),
-        ("Movie Not Found", test.test_search_movie_not_found),
+        ("Movie Search", lambda: test.test_search_movie_with_valid_key(tmdb)),
+        ("TV Show Search", lambda: test.test_search_tv_show_with_valid_key(show)),
+        ("TV Season Details", lambda: test.test_get_tv_season_details(tmdb, show)),
+        ("Movie Not Found", lambda: test.test_search_movie_not_found(tmdb)),
         ("Invalid API Key", test.test_invalid_api_key),
         ("No API Key", test.test_no_api_key),
-        ("Movie Search (No Year)", test.test_search_movie_without_year),
+        ("Movie Search (No Year)", lambda: test.test_search_movie_without_year(tmdb)),
     ]
     
     passed = 0
@@ -3,6 +3,7 @@ import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from services.rag_service import RAGService
 from database.models import ChatMessage
+from tests.conftest import bulk_create
 
 
 class TestRAGService:
@@ -48,9 +49,7 @@ class TestRAGService:
             created_at=base_time + timedelta(seconds=1)  # Ensure assistant is created after user
         )
         
-        db_session.add(user_msg)
-        db_session.add(assistant_msg)
-        await db_session.commit()
+        await bulk_create(db_session, [user_msg, assistant_msg])
         
         # Mock AsyncSessionLocal to use our test session
         from unittest.mock import AsyncMock
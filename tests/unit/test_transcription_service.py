@@ -0,0 +1,50 @@
+"""Unit tests for TranscriptionService."""
+import pytest
+from unittest.mock import AsyncMock
+from services.transcription_service import TranscriptionService
+
+
+class TestTranscriptionService:
+    """Test cases for TranscriptionService."""
+
+    @pytest.fixture
+    def transcription_service(self):
+        """Create a TranscriptionService instance for testing."""
+        return TranscriptionService()
+
+    @pytest.mark.asyncio
+    async def test_repeated_audio_served_from_cache(self, transcription_service):
+        """Test identical audio does not hit providers twice."""
+        transcription_service._transcribe_uncached = AsyncMock(
+            return_value=("hello world", "deepgram", 120.0)
+        )
+
+        first = await transcription_service.transcribe(b"audio")
+        second = await transcription_service.transcribe(b"audio")
+
+        assert first == second == ("hello world", "deepgram", 120.0)
+        transcription_service._transcribe_uncached.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_cache_bypasses_cache(self, transcription_service):
+        """Test no_cache=True always calls providers."""
+        transcription_service._transcribe_uncached = AsyncMock(
+            return_value=("hello world", "deepgram", 120.0)
+        )
+
+        await transcription_service.transcribe(b"audio", no_cache=True)
+        await transcription_service.transcribe(b"audio", no_cache=True)
+
+        assert transcription_service._transcribe_uncached.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_transcription_not_cached(self, transcription_service):
+        """Test empty results are retried rather than cached."""
+        transcription_service._transcribe_uncached = AsyncMock(
+            return_value=(None, "none", 0.0)
+        )
+
+        await transcription_service.transcribe(b"audio")
+        await transcription_service.transcribe(b"audio")
+
+        assert transcription_service._transcribe_uncached.await_count == 2
@@ -0,0 +1,77 @@
+"""Unit tests for VideoConverter."""
+import asyncio
+import json
+import subprocess
+import sys
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from services.video_converter import VideoConverter
+
+
+# Stand-in for ffmpeg: creates its output file, then keeps "encoding"
+FAKE_FFMPEG_SCRIPT = "import sys, time; open(sys.argv[1], 'wb').write(b'partial'); time.sleep(60)"
+
+
+class TestVideoConverter:
+    """Test cases for VideoConverter."""
+
+    @pytest.fixture
+    def converter(self, tmp_path):
+        """Create a VideoConverter over a library holding one MKV."""
+        movies = tmp_path / "Movies"
+        movies.mkdir()
+        (movies / "film.mkv").write_bytes(b"\0" * 2048)
+        converter = VideoConverter(str(tmp_path), max_concurrent=1)
+        converter._probe_media = AsyncMock(
+            return_value={"video_codec": "h264", "audio_codec": "aac", "duration": None}
+        )
+        yield converter
+        converter._executor.shutdown(wait=False)
+
+    @pytest.mark.asyncio
+    async def test_cancel_streaming_stops_ffmpeg_and_removes_partial_output(self, converter, tmp_path):
+        """Test closing the event stream mid-file stops ffmpeg and cleans up its .part output."""
+        real_popen = subprocess.Popen
+        spawned = []
+
+        def fake_popen(cmd, **kwargs):
+            process = real_popen([sys.executable, "-c", FAKE_FFMPEG_SCRIPT, cmd[-1]], **kwargs)
+            spawned.append(process)
+            return process
+
+        with patch("services.video_converter.subprocess.Popen", side_effect=fake_popen):
+            events = converter.convert_all_streaming()
+            async for event in events:
+                if event["type"] == "converting":
+                    break
+            # Wait until the fake ffmpeg is running and has written its partial output
+            for _ in range(500):
+                if list(tmp_path.rglob("*.part")):
+                    break
+                await asyncio.sleep(0.01)
+            assert spawned and list(tmp_path.rglob("*.part"))
+
+            await events.aclose()
+
+        assert spawned[0].poll() is not None, "ffmpeg child is still running"
+        assert not list(tmp_path.rglob("*.part"))
+        assert (tmp_path / "Movies" / "film.mkv").exists()
+        assert not (tmp_path / "Movies" / "film.mp4").exists()
+
+    @pytest.mark.parametrize(
+        "streams,duration,expected",
+        [
+            (["video", "audio"], "99.5", True),
+            (["video"], "100.0", False),  # Audio track dropped
+            (["video", "audio"], "50.0", False),  # Truncated
+        ],
+        ids=["matching", "missing-audio", "truncated"],
+    )
+    def test_output_verified_against_source(self, converter, tmp_path, streams, duration, expected):
+        """Test a converted file must keep the source's streams and duration before it is accepted."""
+        probe = {"streams": [{"codec_type": t} for t in streams], "format": {"duration": duration}}
+        ffprobe = MagicMock(returncode=0, stdout=json.dumps(probe).encode())
+        media_info = {"video_codec": "h264", "audio_codec": "aac", "duration": 100.0}
+
+        with patch("services.video_converter.subprocess.run", return_value=ffprobe):
+            assert converter._output_matches_source_sync(tmp_path / "film.mp4.part", media_info) is expected
@@ -1,6 +1,88 @@
 """Utility for cleaning text before sending to TTS systems."""
 import re
 
+# Common contractions, expanded before apostrophes are removed for better TTS pronunciation
+CONTRACTIONS = {
+    "I'm": "I am",
+    "you're": "you are",
+    "he's": "he is",
+    "she's": "she is",
+    "it's": "it is",
+    "we're": "we are",
+    "they're": "they are",
+    "I've": "I have",
+    "you've": "you have",
+    "we've": "we have",
+    "they've": "they have",
+    "I'll": "I will",
+    "you'll": "you will",
+    "he'll": "he will",
+    "she'll": "she will",
+    "it'll": "it will",
+    "we'll": "we will",
+    "they'll": "they will",
+    "I'd": "I would",
+    "you'd": "you would",
+    "he'd": "he would",
+    "she'd": "she would",
+    "it'd": "it would",
+    "we'd": "we would",
+    "they'd": "they would",
+    "isn't": "is not",
+    "aren't": "are not",
+    "wasn't": "was not",
+    "weren't": "were not",
+    "hasn't": "has not",
+    "haven't": "have not",
+    "hadn't": "had not",
+    "doesn't": "does not",
+    "don't": "do not",
+    "didn't": "did not",
+    "won't": "will not",
+    "wouldn't": "would not",
+    "can't": "cannot",
+    "couldn't": "could not",
+    "shouldn't": "should not",
+    "mightn't": "might not",
+    "mustn't": "must not",
+    "let's": "let us",
+    "that's": "that is",
+    "who's": "who is",
+    "what's": "what is",
+    "where's": "where is",
+    "when's": "when is",
+    "why's": "why is",
+    "how's": "how is",
+    "there's": "there is",
+    "here's": "here is",
+}
+
+# Words ending in one of the contraction suffixes ('m, 're, 's, 've, 'll, 'd, 't); matches are
+# looked up in CONTRACTIONS, so expanding them all is a single scan of the text
+_CONTRACTION_EXPANSIONS = {contraction.casefold(): expanded for contraction, expanded in CONTRACTIONS.items()}
+_CONTRACTION_SUFFIXES = sorted({contraction.split("'")[1] for contraction in CONTRACTIONS}, key=len, reverse=True)
+CONTRACTION_RE = re.compile(r"\b[a-z]+'(?:" + '|'.join(_CONTRACTION_SUFFIXES) + r")\b", re.IGNORECASE)
+
+# Cleaning patterns, compiled once at import
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+ITALIC_ASTERISK_RE = re.compile(r'\*([^*]+)\*')
+ITALIC_UNDERSCORE_RE = re.compile(r'_([^_]+)_')
+MARKDOWN_LINK_RE = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+MARKDOWN_IMAGE_RE = re.compile(r'!\[([^\]]*)\]\([^\)]+\)')
+SQUARE_BRACKETS_RE = re.compile(r'\[([^\]]+)\]')
+PARENTHESES_RE = re.compile(r'\(([^\)]+)\)')
+CURLY_BRACES_RE = re.compile(r'\{[^}]+\}')
+ANGLE_BRACKETS_RE = re.compile(r'[<>]')
+UNSPEAKABLE_CHARS_RE = re.compile(r'[|\\~^]')
+SPECIAL_CHAR_RUN_RE = re.compile(r'[^\w\s\.\,\!\?\:\;\-]+')
+WHITESPACE_RE = re.compile(r'\s+')
+
+
+def _expand_contraction(match: re.Match) -> str:
+    word = match.group(0)
+    return _CONTRACTION_EXPANSIONS.get(word.casefold(), word)
+
 
 def clean_text_for_tts(text: str) -> str:
     """
@@ -25,69 +107,11 @@ def clean_text_for_tts(text: str) -> str:
         return ""
     
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    text = HTML_TAG_RE.sub('', text)
     
     # Expand common contractions before removing apostrophes
-    # This ensures better TTS pronunciation
-    contractions = {
-        "I'm": "I am",
-        "you're": "you are",
-        "he's": "he is",
-        "she's": "she is",
-        "it's": "it is",
-        "we're": "we are",
-        "they're": "they are",
-        "I've": "I have",
-        "you've": "you have",
-        "we've": "we have",
-        "they've": "they have",
-        "I'll": "I will",
-        "you'll": "you will",
-        "he'll": "he will",
-        "she'll": "she will",
-        "it'll": "it will",
-        "we'll": "we will",
-        "they'll": "they will",
-        "I'd": "I would",
-        "you'd": "you would",
-        "he'd": "he would",
-        "she'd": "she would",
-        "it'd": "it would",
-        "we'd": "we would",
-        "they'd": "they would",
-        "isn't": "is not",
-        "aren't": "are not",
-        "wasn't": "was not",
-        "weren't": "were not",
-        "hasn't": "has not",
-        "haven't": "have not",
-        "hadn't": "had not",
-        "doesn't": "does not",
-        "don't": "do not",
-        "didn't": "did not",
-        "won't": "will not",
-        "wouldn't": "would not",
-        "can't": "cannot",
-        "couldn't": "could not",
-        "shouldn't": "should not",
-        "mightn't": "might not",
-        "mustn't": "must not",
-        "let's": "let us",
-        "that's": "that is",
-        "who's": "who is",
-        "what's": "what is",
-        "where's": "where is",
-        "when's": "when is",
-        "why's": "why is",
-        "how's": "how is",
-        "there's": "there is",
-        "here's": "here is",
-    }
-    
-    # Replace contractions (case-insensitive)
-    for contraction, expanded in contractions.items():
-        # Match word boundaries to avoid replacing parts of words
-        text = re.sub(r'\b' + re.escape(contraction) + r'\b', expanded, text, flags=re.IGNORECASE)
+    # This ensures better TTS pronunciation (case-insensitive, word boundaries only)
+    text = CONTRACTION_RE.sub(_expand_contraction, text)
     
     # Remove any remaining apostrophes
     text = text.replace("'", "")
@@ -96,9 +120,9 @@ def clean_text_for_tts(text: str) -> str:
     
     # Remove markdown formatting
     # Remove bold/italic markers: **, *, _
-    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # Bold: **text** -> text
-    text = re.sub(r'\*([^*]+)\*', r'\1', text)  # Italic: *text* -> text
-    text = re.sub(r'_([^_]+)_', r'\1', text)  # Italic: _text_ -> text
+    text = BOLD_RE.sub(r'\1', text)  # Bold: **text** -> text
+    text = ITALIC_ASTERISK_RE.sub(r'\1', text)  # Italic: *text* -> text
+    text = ITALIC_UNDERSCORE_RE.sub(r'\1', text)  # Italic: _text_ -> text
     
     # Remove remaining asterisks, underscores, hash symbols
     text = text.replace('*', '')
@@ -106,31 +130,31 @@ def clean_text_for_tts(text: str) -> str:
     text = text.replace('#', '')
     
     # Remove markdown links: [text](url) -> text
-    text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+    text = MARKDOWN_LINK_RE.sub(r'\1', text)
     
     # Remove markdown images: ![alt](url) -> alt
-    text = re.sub(r'!\[([^\]]*)\]\([^\)]+\)', r'\1', text)
+    text = MARKDOWN_IMAGE_RE.sub(r'\1', text)
     
     # Remove brackets and braces (but keep content)
-    text = re.sub(r'\[([^\]]+)\]', r'\1', text)  # [text] -> text
-    text = re.sub(r'\(([^\)]+)\)', r'\1', text)  # (text) -> text (but keep basic punctuation)
+    text = SQUARE_BRACKETS_RE.sub(r'\1', text)  # [text] -> text
+    text = PARENTHESES_RE.sub(r'\1', text)  # (text) -> text (but keep basic punctuation)
     
     # Remove curly braces content: {text} -> (empty, or just remove braces)
-    text = re.sub(r'\{[^}]+\}', '', text)
+    text = CURLY_BRACES_RE.sub('', text)
     
     # Remove characters that can't be spoken (standalone special characters)
     # Remove standalone > and < (but keep content if they're part of words/numbers)
-    text = re.sub(r'[<>]', '', text)  # Remove standalone < and >
+    text = ANGLE_BRACKETS_RE.sub('', text)  # Remove standalone < and >
     
     # Remove other non-speakable characters that might appear standalone
     # Keep common punctuation like . , ! ? : ; - but remove others
-    text = re.sub(r'[|\\~^]', '', text)  # Remove pipe, backslash, tilde, caret
+    text = UNSPEAKABLE_CHARS_RE.sub('', text)  # Remove pipe, backslash, tilde, caret
     
     # Remove multiple consecutive special characters
-    text = re.sub(r'[^\w\s\.\,\!\?\:\;\-]+', ' ', text)  # Replace any remaining non-word/sentence chars with space
+    text = SPECIAL_CHAR_RUN_RE.sub(' ', text)  # Replace any remaining non-word/sentence chars with space
     
     # Clean up multiple spaces
-    text = re.sub(r'\s+', ' ', text)
+    text = WHITESPACE_RE.sub(' ', text)
     
     # Remove leading/trailing whitespace
     text = text.strip()
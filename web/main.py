@@ -1,5 +1,5 @@
 """FastAPI application for the web GUI."""
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, UploadFile, File, Form
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, UploadFile, File, Form, Depends
 from fastapi.responses import HTMLResponse, StreamingResponse, FileResponse, JSONResponse, Response
 from fastapi import Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -28,7 +28,7 @@ from mutagen.mp3 import MP3
 from mutagen.easyid3 import EasyID3
 from database.base import AsyncSessionLocal, engine as db_engine
 from database.models import DeviceConnection, DeviceTelemetry, ChatMessage, CollectedData, MusicArtist, MusicAlbum, MusicSong, MusicPlay, MusicPlaylist, MusicPlaylistSong, OctopusEnergyConsumption, OctopusEnergyTariff, OctopusEnergyTariffRate, ChatSession, ArticleSummary, Alarm, AlarmType, PromptPreset, AIModelCache, VideoMovie, VideoTVShow, VideoTVSeason, VideoTVEpisode, VideoPlaybackProgress, VideoSimilarContent, ActorFilmography, MovieCastCrew, TVShowCastCrew, SystemConfig, ApiKeysConfig, User, Story, Plot, StoryCast, StoryScreenplayVersion, StoryComplete, Course, CourseSection, CourseSubsection, Lesson, CourseQuestion, ScraperSource, ScrapedArticle, ArticleTextContent, ArticleHtmlContent, PersonalChat, PersonalSummary
-from sqlalchemy import select, desc, func, or_, delete, and_, text
+from sqlalchemy import select, desc, func, or_, delete, and_, text, insert
 from sqlalchemy.orm import selectinload
 from sqlalchemy.orm.attributes import flag_modified
 from sqlalchemy.exc import OperationalError
@@ -39,7 +39,7 @@ from config.api_key_loader import load_api_keys, save_api_keys
 from config.expert_types_loader import list_expert_types
 from config.router_loader import load_router_config, save_router_config
 from services.rag_service import RAGService
-from services.tts_service import TTSService
+from services.tts_service import TTSService, AUDIO_MEDIA_TYPES
 from services.ai_service import AIService
 from data_collectors.weather_collector import WeatherCollector
 from data_collectors.news_collector import NewsCollector
@@ -1716,6 +1716,87 @@ async def save_ai_focus_message(request: Request):
         return {"success": False, "error": str(e)}
 
 
+@app.post("/api/ai/focus/save-messages")
+async def save_ai_focus_messages(request: Request):
+    """
+    Save several AI focus question/answer pairs to one session in a single request.
+    
+    Body: {"session_id", "messages": [{"question", "answer", "audio_file_path"?}, ...],
+    "mode"?, "persona"?, "user_id"?}. Messages are written with one bulk INSERT, in order.
+    The single-message endpoint stays the one to use while streaming answers.
+    """
+    try:
+        payload = await request.json()
+        session_id = payload.get("session_id")
+        messages = payload.get("messages") or []
+        mode = payload.get("mode", "question")  # 'question' or 'task'
+        persona = payload.get("persona")
+        user_id = payload.get("user_id")
+        
+        if not session_id:
+            return {"success": False, "error": "session_id is required"}
+        if not messages or any(not m.get("question") or not m.get("answer") for m in messages):
+            return {"success": False, "error": "Each message needs a question and an answer"}
+        
+        # Get current persona if not provided
+        if not persona:
+            persona = await get_current_persona_name()
+        
+        rows = []
+        for m in messages:
+            rows.append({
+                "session_id": session_id,
+                "role": "user",
+                "message": m["question"],
+                "service_name": "ai_service",
+                "mode": None,
+                "persona": persona,
+                "message_metadata": {}
+            })
+            rows.append({
+                "session_id": session_id,
+                "role": "assistant",
+                "message": m["answer"],
+                "service_name": "ai_service",
+                "mode": None,
+                "persona": persona,
+                "message_metadata": {"audio_file": m["audio_file_path"]} if m.get("audio_file_path") else {}
+            })
+        
+        async with AsyncSessionLocal() as session:
+            # Questions precede their answers in the row list, so ids keep the pair order
+            await session.execute(insert(ChatMessage), rows)
+            
+            if user_id:
+                from datetime import datetime, timezone
+                result = await session.execute(
+                    select(ChatSession).where(ChatSession.session_id == session_id)
+                )
+                chat_session = result.scalar_one_or_none()
+                question = messages[0]["question"]
+                title = f"AI Focus {mode.capitalize()} - {question[:30]}..." if len(question) > 30 else f"AI Focus {mode.capitalize()}"
+                if chat_session:
+                    chat_session.user_id = user_id
+                    chat_session.updated_at = datetime.now(timezone.utc)
+                    if not chat_session.title or chat_session.title.startswith("AI Focus"):
+                        chat_session.title = title
+                else:
+                    session.add(ChatSession(session_id=session_id, user_id=user_id, title=title))
+            
+            await session.commit()
+        
+        logger.info(f"[AI FOCUS] Saved {len(messages)} message pairs: session_id={session_id}, mode={mode}, persona={persona}")
+        
+        return {
+            "success": True,
+            "session_id": session_id,
+            "saved": len(messages)
+        }
+    except Exception as e:
+        logger.error(f"[AI FOCUS] Error saving messages: {e}", exc_info=True)
+        return {"success": False, "error": str(e)}
+
+
 @app.post("/api/ai/focus/save-audio")
 async def save_ai_focus_audio(request: Request):
     """
@@ -8835,9 +8916,12 @@ async def generate_tts(request: Request):
     text = data.get("text")
     message_id = data.get("message_id")  # Optional message ID to update
     persona_name = data.get("persona")  # Optional, defaults to current persona
+    audio_format = data.get("format", "mp3")  # Optional, e.g. "opus" for smaller payloads
     
     if not text:
         raise HTTPException(status_code=400, detail="Text is required")
+    if audio_format not in AUDIO_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unsupported audio format: {audio_format}")
     
     # Load persona config to get voice settings
     persona_config = await load_persona_config(persona_name) if persona_name else await load_persona_config()
@@ -8856,7 +8940,7 @@ async def generate_tts(request: Request):
     
     # Generate audio
     tts_service = TTSService()
-    audio_data, audio_filepath = await tts_service.generate_audio(text, voice_id, voice_engine, save_to_file=True)
+    audio_data, audio_filepath = await tts_service.generate_audio(text, voice_id, voice_engine, save_to_file=True, audio_format=audio_format)
     
     if audio_data is None:
         raise HTTPException(status_code=500, detail="Failed to generate audio")
@@ -8878,7 +8962,7 @@ async def generate_tts(request: Request):
     
     # Return audio file with file path in headers
     response_headers = {
-        "Content-Disposition": "attachment; filename=tts_output.mp3"
+        "Content-Disposition": f"attachment; filename=tts_output.{audio_format}"
     }
     if audio_filepath:
         # Return relative path for the audio file
@@ -8886,7 +8970,7 @@ async def generate_tts(request: Request):
     
     return Response(
         content=audio_data,
-        media_type="audio/mpeg",
+        media_type=AUDIO_MEDIA_TYPES[audio_format],
         headers=response_headers
     )
 
@@ -9609,7 +9693,8 @@ async def scan_video_conversion(request: Request):
         logger.info(f"Video scan-conversion: Initializing VideoConverter for {video_directory}")
         converter = VideoConverter(video_directory)
         logger.info("Video scan-conversion: Starting scan...")
-        scan_results = converter.scan_for_conversion()
+        # Directory walks over network shares block on I/O; keep them off the event loop
+        scan_results = await asyncio.to_thread(converter.scan_for_conversion)
         logger.info(f"Video scan-conversion: Scan complete, found {scan_results.get('summary', {}).get('total_to_convert', 0)} files")
         
         return scan_results
@@ -12881,8 +12966,23 @@ async def check_alarms():
         }
 
 
+def get_weather_collector() -> WeatherCollector:
+    """Dependency providing the weather collector (tests override it via app.dependency_overrides)."""
+    return WeatherCollector()
+
+
+def get_traffic_collector() -> TrafficCollector:
+    """Dependency providing the traffic collector (tests override it via app.dependency_overrides)."""
+    return TrafficCollector()
+
+
+def get_news_collector() -> NewsCollector:
+    """Dependency providing the news collector (tests override it via app.dependency_overrides)."""
+    return NewsCollector()
+
+
 @app.get("/api/weather")
-async def get_weather():
+async def get_weather(collector: WeatherCollector = Depends(get_weather_collector)):
     """Get current weather data for the configured location."""
     try:
         # Try to get latest weather data from database
@@ -12911,7 +13011,6 @@ async def get_weather():
                         }
         
         # Otherwise, collect fresh data
-        collector = WeatherCollector()
         result = await collector.collect()
         
         if "error" in result:
@@ -12953,7 +13052,7 @@ async def get_weather():
 
 
 @app.get("/api/traffic")
-async def get_traffic(radius_miles: int = 30):
+async def get_traffic(radius_miles: int = 30, collector: TrafficCollector = Depends(get_traffic_collector)):
     """Get traffic conditions within the specified radius of the configured location."""
     try:
         # Try to get latest traffic data from database
@@ -12982,7 +13081,6 @@ async def get_traffic(radius_miles: int = 30):
                         }
         
         # Otherwise, collect fresh data
-        collector = TrafficCollector()
         result = await collector.collect(radius_miles=radius_miles)
         
         if "error" in result:
@@ -13024,7 +13122,11 @@ async def get_traffic(radius_miles: int = 30):
 
 
 @app.get("/api/news")
-async def get_news(feed_type: str = "top_stories", limit: int = 50):
+async def get_news(
+    feed_type: str = "top_stories",
+    limit: int = 50,
+    collector: NewsCollector = Depends(get_news_collector)
+):
     """Get news data from BBC RSS feeds."""
     try:
         # Try to get latest news data from database
@@ -13073,7 +13175,6 @@ async def get_news(feed_type: str = "top_stories", limit: int = 50):
                         }
         
         # Otherwise, collect fresh data
-        collector = NewsCollector()
         result = await collector.collect(feed_type=feed_type, limit=limit)
         
         if "error" in result:
@@ -17017,7 +17118,7 @@ async def scan_scraper_source(source_id: int):
                 return {"success": False, "error": "Scraper images directory not configured"}
             
             # Initialize scraper service
-            from services.web_scraper_service import WebScraperService
+            from services.web_scraper_service import WebScraperService, HTML_PARSER
             import httpx
             scraper = WebScraperService(images_directory=images_dir)
             
@@ -17027,22 +17128,13 @@ async def scan_scraper_source(source_id: int):
                 response.raise_for_status()
             
             # Check if this is an RSS/Atom feed
-            content_type = response.headers.get('content-type', '').lower()
-            is_feed = (
-                'xml' in content_type or
-                'rss' in content_type or
-                'atom' in content_type or
-                source.url.endswith('.xml') or
-                source.url.endswith('.rss') or
-                '/feed' in source.url.lower() or
-                '/rss' in source.url.lower()
-            )
+            is_feed = scraper._is_feed_response(response, source.url)
             
             if is_feed:
                 article_urls = scraper._extract_urls_from_feed(response.text)
             else:
                 from bs4 import BeautifulSoup
-                soup = BeautifulSoup(response.text, 'html.parser')
+                soup = BeautifulSoup(response.text, HTML_PARSER)
                 article_urls = scraper._extract_article_urls(soup, source.url)
             
             return {
@@ -17115,6 +17207,8 @@ async def scrape_single_source_stream(source_id: int, request: Request):
                 except Exception as e:
                     logger.error(f"Streaming scrape error: {e}", exc_info=True)
                     yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+                finally:
+                    await scraper.aclose()
             
             return StreamingResponse(
                 event_stream(),
@@ -17169,11 +17263,11 @@ async def scrape_single_source(source_id: int, request: Request):
             
             # Initialize scraper service
             from services.web_scraper_service import WebScraperService
-            scraper = WebScraperService(images_directory=images_dir)
             
             # Scrape this source (no limit = get all articles)
             logger.info(f"Scraping source {source_id}: {source.name} ({source.url}) - Getting all articles")
-            results = await scraper.scrape_source(source, session, limit=limit)
+            async with WebScraperService(images_directory=images_dir) as scraper:
+                results = await scraper.scrape_source(source, session, limit=limit)
             
             # Update last_scraped timestamp
             source.last_scraped = datetime.utcnow()
@@ -17224,11 +17318,11 @@ async def test_scraper_source(source_id: int):
             
             # Initialize scraper service
             from services.web_scraper_service import WebScraperService
-            scraper = WebScraperService(images_directory=images_dir)
             
             # Test scrape this source
             logger.info(f"Testing source {source_id}: {source.name} ({source.url})")
-            results = await scraper.scrape_source(source, session)
+            async with WebScraperService(images_directory=images_dir) as scraper:
+                results = await scraper.scrape_source(source, session)
             
             return {
                 "success": True,
@@ -17509,11 +17603,11 @@ async def test_scraper_url(request: Request):
             
             # Initialize scraper service
             from services.web_scraper_service import WebScraperService
-            scraper = WebScraperService(images_directory=images_dir)
             
             # Test scraping the URL
             logger.info(f"Testing scraper on URL: {test_url}")
-            article_data = await scraper.scrape_article(test_url)
+            async with WebScraperService(images_directory=images_dir) as scraper:
+                article_data = await scraper.scrape_article(test_url)
             
             if article_data:
                 return {